@@ -11,6 +11,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # 导入并运行主程序
 if __name__ == "__main__":
+    # 打包后的可执行文件需要支持页面渲染进程池的子进程启动
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     from pathlib import Path
     from typing import Optional
     
@@ -52,4 +52,8 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # 打包后的可执行文件需要支持页面渲染进程池的子进程启动
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     main()
@@ -22,7 +22,6 @@ from .core import (
     validate_input_file,
     SUPPORTED_INPUT_TYPES
 )
-from .gui import launch_gui
 
 app = typer.Typer(
     name="pdf-zipper",
@@ -56,11 +55,18 @@ def callback(
 
 
 @app.command("gui")
-def gui_command():
+def gui_command(
+    processes: bool = typer.Option(
+        False, "--processes", "-p", help="Run jobs in separate processes so several files compress in parallel"
+    ),
+):
     """🖥️ Launch the graphical user interface."""
     console.print("🚀 Launching PDF Zipper GUI...")
     try:
-        launch_gui()
+        # 延迟导入 Textual，其他命令无需加载 GUI 依赖
+        from .gui import launch_gui
+
+        launch_gui(use_processes=processes)
     except KeyboardInterrupt:
         console.print("\n👋 GUI closed by user")
     except Exception as e:
@@ -80,6 +86,9 @@ def compress_command(
     target_size: Optional[float] = typer.Option(
         None, "--target-size", "-s", help="Target size in MB (auto mode)"
     ),
+    grayscale: bool = typer.Option(
+        False, "--grayscale", "-g", help="Render pages in grayscale (PDF → PDF)"
+    ),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress output"),
 ):
     """🗜️ Compress a file (supports PDF and PPTX)."""
@@ -143,7 +152,9 @@ def compress_command(
         if target_size:
             # Auto-compression mode (supports both PDF and PPTX)
             console.print(f"🎯 Auto-compressing to {target_size} MB...")
-            autocompress(str(input_file), str(output_file), target_size, logger)
+            autocompress(
+                str(input_file), str(output_file), target_size, logger, grayscale=grayscale
+            )
         elif input_ext == ".pptx":
             # PPTX to PDF conversion (manual mode)
             console.print(f"📊 Converting PPTX to PDF...")
@@ -151,7 +162,7 @@ def compress_command(
         else:
             # PDF manual compression
             console.print(f"🗜️ Compressing with {dpi} DPI...")
-            compress_pdf(str(input_file), str(output_file), dpi, logger)
+            compress_pdf(str(input_file), str(output_file), dpi, logger, grayscale)
 
         if not quiet:
             console.print(f"✅ Processing complete: {output_file}", style="green")
@@ -168,6 +179,9 @@ def convert_command(
         None, "--output", "-o", help="Output file path"
     ),
     dpi: int = typer.Option(150, "--dpi", "-d", help="DPI for images (default: 150)"),
+    lossless: bool = typer.Option(
+        False, "--lossless", help="Embed slides as PNG instead of JPEG (PDF → PPTX)"
+    ),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress output"),
 ):
     """📊 Convert between PDF and PowerPoint formats."""
@@ -213,7 +227,7 @@ def convert_command(
         if input_ext == ".pdf":
             # PDF to PowerPoint
             console.print(f"📊 Converting PDF to PowerPoint with {dpi} DPI...")
-            convert_to_ppt(str(input_file), str(output_file), dpi, logger)
+            convert_to_ppt(str(input_file), str(output_file), dpi, logger, lossless)
         elif input_ext == ".pptx":
             # PowerPoint to PDF
             console.print(f"📄 Converting PowerPoint to PDF...")
@@ -4,17 +4,30 @@ Core PDF processing functionality.
 This module contains the main PDF compression and conversion logic.
 """
 
+import atexit
 import io
+import math
+import multiprocessing
 import os
 import platform
+import shutil
+import sys
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
-import fitz  # PyMuPDF
-from PIL import Image
-from pptx import Presentation
-from pptx.util import Inches
+# PyMuPDF / Pillow / python-pptx 体积较大，只在真正需要时于函数内部导入，
+# 这样 `--help`、文件校验等轻量操作无需加载这些 C 扩展
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+    from PIL import Image
+
+_IS_WINDOWS = platform.system() == "Windows"
 
 # 支持的文件类型
 SUPPORTED_INPUT_TYPES = {
@@ -27,6 +40,91 @@ SUPPORTED_OUTPUT_TYPES = {
     '.pptx': 'PowerPoint Presentation',
 }
 
+# LibreOffice 共享用户配置目录（首次转换时创建，进程退出时清理）
+_LIBREOFFICE_PROFILE_DIR: Optional[str] = None
+
+# 外部转换工具的可执行文件路径（启动时查找，check_conversion_tools() 会重新查找；未安装时为 None）
+_LIBREOFFICE_PATH = shutil.which("libreoffice")
+_UNOCONV_PATH = shutil.which("unoconv")
+
+# 页面光栅化进程池（首次使用时创建，进程退出时关闭）
+_RENDER_POOL: Optional[ProcessPoolExecutor] = None
+_RENDER_WORKERS = os.cpu_count() or 1
+# 页数较少时直接在当前进程渲染，避免进程间传输数据的开销
+_PARALLEL_MIN_PAGES = 4
+
+# PPTX 幻灯片图像的最大边长（像素），超过时降低渲染分辨率
+_PPTX_MAX_IMAGE_DIMENSION = 1920
+
+# 写出最终文件时使用的缓冲区/分块大小
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 压缩后 PDF 中页面图像的 JPEG 质量（与此前 Pillow PDF 写入器的默认值一致）
+_PDF_JPEG_QUALITY = 75
+
+# 单页渲染结果：(页面宽度 pt, 页面高度 pt, 编码后的图像数据, 错误信息)，失败时图像数据为 None
+RenderedPage = Tuple[float, float, Optional[memoryview], Optional[str]]
+
+
+class RenderedPages:
+    """
+    按页面顺序保存的渲染结果
+
+    采用结构数组布局：所有页面的图像数据依次存放在同一个 bytearray 中，
+    其余字段各自保存在并列的列表里。相比每页一个 bytes 对象，
+    跨进程传输和缓存时对象数量少、内存分配也更集中。
+    迭代时返回 RenderedPage，图像数据是指向共享缓冲区的 memoryview。
+    """
+
+    __slots__ = ("data", "offsets", "widths", "heights", "errors")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets: List[int] = [0]
+        self.widths: List[float] = []
+        self.heights: List[float] = []
+        self.errors: List[Optional[str]] = []
+
+    def append(
+        self, width: float, height: float, image: Optional[bytes], error: Optional[str] = None
+    ) -> None:
+        """追加一页；image 为 None 表示该页渲染失败"""
+        if image is not None:
+            self.data += image
+        self.offsets.append(len(self.data))
+        self.widths.append(width)
+        self.heights.append(height)
+        self.errors.append(error)
+
+    def extend(self, other: "RenderedPages") -> None:
+        """追加另一组渲染结果（如工作进程返回的一个分块）"""
+        base = len(self.data)
+        self.data += other.data
+        self.offsets.extend(base + offset for offset in other.offsets[1:])
+        self.widths.extend(other.widths)
+        self.heights.extend(other.heights)
+        self.errors.extend(other.errors)
+
+    @property
+    def nbytes(self) -> int:
+        """所有图像数据的总字节数"""
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __iter__(self) -> Iterator[RenderedPage]:
+        view = memoryview(self.data)
+        for i, error in enumerate(self.errors):
+            image = None if error is not None else view[self.offsets[i]:self.offsets[i + 1]]
+            yield self.widths[i], self.heights[i], image, error
+
+
+# DPI 搜索期间的渲染结果缓存：(文件路径, DPI, 是否灰度) -> 渲染结果，按总字节数做 LRU 淘汰
+_RENDER_CACHE: "OrderedDict[Tuple[str, int, bool], RenderedPages]" = OrderedDict()
+_RENDER_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_RENDER_CACHE_LOCK = threading.Lock()
+
 
 def get_file_type(file_path: str) -> Tuple[str, str]:
     """
@@ -64,28 +162,331 @@ def validate_input_file(file_path: str) -> bool:
     return ext in SUPPORTED_INPUT_TYPES
 
 
-def _generate_pdf_data(
-    doc: fitz.Document, dpi: float, logger_func: Callable[[str], None]
-) -> Optional[bytes]:
-    """Generates PDF data in memory and logs progress."""
-    image_list = []
-    total_pages = len(doc)
-    logger_func(f"Converting {total_pages} pages with DPI {int(dpi)}...")
+def _samples_to_image(
+    width: int, height: int, samples, mode: str = "RGB", stride: int = 0
+) -> "Image.Image":
+    """
+    将 RGB（或灰度 "L"）像素缓冲区复制为 PIL 图像
+
+    像素数据只复制一次，返回的图像持有自己的内存，不依赖 pixmap 的生命周期。
+    传入 pixmap.samples_mv 可以避免 pixmap.samples 额外生成的 bytes 副本。
+
+    Args:
+        width: 图像宽度（像素）
+        height: 图像高度（像素）
+        samples: 像素缓冲区，通常为 pixmap.samples_mv
+        mode: PIL 图像模式（"RGB" 或 "L"）
+        stride: 每行字节数，0 表示按 width 紧密排列
+
+    Returns:
+        Image.Image: 独立于 samples 的 PIL 图像
+    """
+    from PIL import Image
+
+    # 不用 frombuffer："L" 等映射模式会与缓冲区共享内存，pixmap 先释放时会出错
+    return Image.frombytes(mode, (width, height), samples, "raw", mode, stride, 1)
+
+
+def _encode_jpeg(img: "Image.Image", quality: int, optimize: bool = False) -> bytes:
+    """
+    将图像编码为 JPEG 数据
+
+    保持 Pillow 默认的分块输出 (ImageFile.MAXBLOCK)：该值是进程级全局变量，
+    GUI 会在多个线程中同时编码，临时修改它并不安全，而且写入内存缓冲区时
+    分块并不会变慢。
+
+    Args:
+        img: PIL图像对象
+        quality: JPEG质量 (1-100)
+        optimize: 是否优化 Huffman 表（更小但更慢）
+
+    Returns:
+        bytes: JPEG 数据
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=quality, optimize=optimize)
+    return buffer.getvalue()
+
+
+def _render_each_page(
+    input_path: str,
+    page_indices: List[int],
+    encode_page: Callable[["fitz.Page"], bytes],
+    logger_func: Optional[Callable[[str], None]] = None,
+) -> RenderedPages:
+    """
+    依次渲染并编码指定页面，单页失败时记录错误并继续
+
+    fitz.Document 无法跨进程传递，因此每个任务按路径打开一次文档，
+    然后依次处理分配到的页面。
+
+    Args:
+        input_path: PDF 文件路径
+        page_indices: 需要渲染的页面索引
+        encode_page: 将单个页面渲染并编码为图像数据的函数
+        logger_func: 进度日志函数（仅在当前进程渲染时使用）
+
+    Returns:
+        RenderedPages: 与 page_indices 顺序一致的渲染结果
+    """
+    import fitz
+
+    results = RenderedPages()
+    total = len(page_indices)
+    with fitz.open(input_path) as doc:
+        for index in page_indices:
+            try:
+                page = doc[index]
+                results.append(page.rect.width, page.rect.height, encode_page(page))
+            except Exception as e:
+                results.append(0, 0, None, str(e))
+            if logger_func and (len(results) % 10 == 0 or len(results) == total):
+                logger_func(f"  - Converted page {len(results)}/{total}")
+    return results
+
+
+def _render_page_range(
+    input_path: str,
+    page_indices: List[int],
+    dpi: int,
+    jpeg_quality: int = _PDF_JPEG_QUALITY,
+    grayscale: bool = False,
+    logger_func: Optional[Callable[[str], None]] = None,
+) -> RenderedPages:
+    """
+    渲染指定页面并编码为 JPEG（可在工作进程中执行）
+
+    JPEG 编码在工作进程中完成，主进程只需把编码结果原样放入 PDF。
+
+    Args:
+        input_path: PDF 文件路径
+        page_indices: 需要渲染的页面索引
+        dpi: 渲染分辨率
+        jpeg_quality: JPEG 质量 (1-100)
+        grayscale: 是否按单通道灰度渲染（像素数据只有 RGB 的三分之一）
+        logger_func: 进度日志函数（仅在当前进程渲染时使用）
+
+    Returns:
+        RenderedPages: 与 page_indices 顺序一致的渲染结果
+    """
+    import fitz
+
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    mode = "L" if grayscale else "RGB"
+
+    def encode_page(page: "fitz.Page") -> bytes:
+        pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+        # Pillow (libjpeg-turbo) 的 JPEG 编码明显快于 MuPDF 内置编码器
+        img = _samples_to_image(pix.width, pix.height, pix.samples_mv, mode, pix.stride)
+        return _encode_jpeg(img, jpeg_quality)
+
+    return _render_each_page(input_path, page_indices, encode_page, logger_func)
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """获取共享的页面渲染进程池"""
+    global _RENDER_POOL
+
+    if _RENDER_POOL is None:
+        # 使用 spawn 启动工作进程：GUI 在后台线程中调用时 fork 并不安全
+        _RENDER_POOL = ProcessPoolExecutor(
+            max_workers=_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(_RENDER_POOL.shutdown)
+
+    return _RENDER_POOL
+
+
+def _discard_render_pool() -> None:
+    """关闭已损坏的进程池并丢弃，取消尚未开始的任务，下次使用时重新创建"""
+    global _RENDER_POOL
 
-    for i, page in enumerate(doc):
+    pool, _RENDER_POOL = _RENDER_POOL, None
+    if pool is None:
+        return
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        pool.shutdown(wait=False)
+
+
+def _render_pages(
+    input_path: str,
+    page_count: int,
+    dpi: int,
+    logger_func: Callable[[str], None],
+    render_func: Callable[..., RenderedPages] = _render_page_range,
+    **render_kwargs,
+) -> RenderedPages:
+    """
+    渲染文档的所有页面，页数较多时分块并行渲染
+
+    Args:
+        input_path: PDF 文件路径
+        page_count: 文档页数
+        dpi: 渲染分辨率
+        logger_func: 日志记录函数
+        render_func: 渲染一组页面的模块级函数（需可被工作进程 pickle）
+        **render_kwargs: 传给 render_func 的其他参数
+
+    Returns:
+        RenderedPages: 按页面顺序排列的渲染结果
+    """
+    if _RENDER_WORKERS > 1 and page_count >= _PARALLEL_MIN_PAGES:
+        chunk_size = -(-page_count // _RENDER_WORKERS)
+        chunks = [
+            list(range(start, min(start + chunk_size, page_count)))
+            for start in range(0, page_count, chunk_size)
+        ]
         try:
-            pix = page.get_pixmap(dpi=int(dpi))
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            image_list.append(img)
-            if (i + 1) % 10 == 0 or i + 1 == total_pages:
-                logger_func(f"  - Converted page {i+1}/{total_pages}")
-        except Exception as e:
+            pool = _get_render_pool()
+            task = partial(render_func, dpi=dpi, **render_kwargs)
+            results = RenderedPages()
+            for chunk_results in pool.map(task, [input_path] * len(chunks), chunks):
+                results.extend(chunk_results)
+                logger_func(f"  - Converted page {len(results)}/{page_count}")
+            return results
+        except (BrokenProcessPool, OSError) as e:
+            # 进程池不可用（如受限环境、工作进程崩溃）时退回到单进程渲染；
+            # 渲染本身的错误照常抛出
+            logger_func(
+                f"[yellow]Parallel rendering unavailable ({e}), rendering sequentially...[/yellow]"
+            )
+            _discard_render_pool()
+
+    return render_func(
+        input_path,
+        list(range(page_count)),
+        dpi=dpi,
+        logger_func=logger_func,
+        **render_kwargs,
+    )
+
+
+def _render_pages_cached(
+    input_path: str,
+    page_count: int,
+    dpi: int,
+    logger_func: Callable[[str], None],
+    grayscale: bool = False,
+) -> RenderedPages:
+    """
+    带缓存的页面渲染，DPI 搜索中重复尝试同一 DPI 时直接复用之前的结果
+
+    缓存按 (文件路径, DPI, 是否灰度) 索引，总大小超过上限时淘汰最久未使用的条目。
+    调用方在搜索结束后应调用 _clear_render_cache() 释放内存。
+    """
+    key = (input_path, dpi, grayscale)
+    with _RENDER_CACHE_LOCK:
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+    if cached is not None:
+        logger_func(f"  - Reusing pages already rendered at DPI {dpi}")
+        return cached
+
+    rendered_pages = _render_pages(
+        input_path, page_count, dpi, logger_func, grayscale=grayscale
+    )
+    _store_rendered_pages(key, rendered_pages)
+    return rendered_pages
+
+
+def _store_rendered_pages(key: Tuple[str, int, bool], rendered_pages: RenderedPages) -> None:
+    """将渲染结果放入缓存，总大小超过上限时淘汰最久未使用的条目"""
+    if rendered_pages.nbytes > _RENDER_CACHE_MAX_BYTES:
+        return
+
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[key] = rendered_pages
+        cached_size = sum(pages.nbytes for pages in _RENDER_CACHE.values())
+        while cached_size > _RENDER_CACHE_MAX_BYTES:
+            _, evicted = _RENDER_CACHE.popitem(last=False)
+            cached_size -= evicted.nbytes
+
+
+def _submit_speculative_renders(
+    input_path: str, page_count: int, dpis: Tuple[int, ...], grayscale: bool
+) -> Dict[int, Future]:
+    """
+    在进程池空闲时提前渲染 DPI 搜索下一步可能用到的分辨率
+
+    页数较少时主渲染在当前进程完成，进程池处于空闲状态，可以同时渲染几个候选 DPI，
+    用不到的结果直接丢弃。页数较多时每次渲染已占满所有工作进程，推测执行只会互相争抢，
+    因此返回空字典。进程池尚未创建时同样返回空字典：为了推测执行而启动工作进程，
+    开销往往超过小文档本身的渲染时间。
+    """
+    pool = _RENDER_POOL
+    if _RENDER_WORKERS < 2 or pool is None or page_count >= _PARALLEL_MIN_PAGES:
+        return {}
+
+    try:
+        return {
+            dpi: pool.submit(
+                _render_page_range,
+                input_path,
+                list(range(page_count)),
+                dpi,
+                grayscale=grayscale,
+            )
+            for dpi in dpis
+        }
+    except (BrokenProcessPool, RuntimeError):
+        # 进程池已损坏或已关闭，放弃推测执行
+        return {}
+
+
+def _clear_render_cache() -> None:
+    """释放 DPI 搜索期间缓存的渲染结果"""
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE.clear()
+
+
+def _generate_pdf_data(
+    input_path: str,
+    page_count: int,
+    dpi: float,
+    logger_func: Callable[[str], None],
+    use_cache: bool = False,
+    grayscale: bool = False,
+) -> Optional[io.BytesIO]:
+    """
+    Generates PDF data in memory and logs progress.
+
+    With ``grayscale=True`` pages are rendered as single-channel gray images,
+    which is a third of the pixel data and usually a much smaller file for
+    scans and text-only documents.
+
+    The result is returned as a ``BytesIO`` so callers can measure it with
+    ``getbuffer().nbytes`` and stream it to disk without another copy.
+
+    With ``use_cache=True`` rendered pages are kept in the render cache so a
+    DPI search can reuse them; callers must clear it with _clear_render_cache().
+    """
+    logger_func(f"Converting {page_count} pages with DPI {int(dpi)}...")
+
+    import fitz
+
+    render = _render_pages_cached if use_cache else _render_pages
+    rendered_pages = render(
+        input_path, page_count, int(dpi), logger_func, grayscale=grayscale
+    )
+
+    # 直接把已编码的 JPEG 放入新文档，保持原始页面尺寸，无需再次编码
+    out_doc = fitz.open()
+    for i, (width, height, jpeg, error) in enumerate(rendered_pages):
+        if jpeg is None:
             logger_func(
-                f"[bold red]Warning:[/bold red] Error processing page {i+1}, skipped. Error: {e}"
+                f"[bold red]Warning:[/bold red] Error processing page {i+1}, skipped. Error: {error}"
             )
             continue
+        page = out_doc.new_page(width=width, height=height)
+        # PyMuPDF 不接受 memoryview，这里按页复制出独立的 bytes
+        page.insert_image(page.rect, stream=bytes(jpeg))
 
-    if not image_list:
+    if len(out_doc) == 0:
+        out_doc.close()
         logger_func(
             "[bold red]Error:[/bold red] No images were generated from the PDF."
         )
@@ -93,77 +494,173 @@ def _generate_pdf_data(
 
     logger_func("Saving PDF data to memory buffer...")
     pdf_buffer = io.BytesIO()
-    image_list[0].save(
-        pdf_buffer,
-        "PDF",
-        resolution=float(dpi),
-        save_all=True,
-        append_images=image_list[1:],
-    )
+    # garbage=4 合并重复的页面图像（如空白页），deflate 压缩页面内容流
+    out_doc.save(pdf_buffer, garbage=4, deflate=True)
+    out_doc.close()
     logger_func("[green]In-memory save complete.[/green]")
-    return pdf_buffer.getvalue()
+    return pdf_buffer
+
+
+def _write_pdf_buffer(pdf_buffer: io.BytesIO, output_path: str) -> None:
+    """
+    将内存中的 PDF 数据分块写入文件，写完后关闭缓冲区以立即释放内存
+
+    Args:
+        pdf_buffer: _generate_pdf_data 返回的缓冲区（调用后不可再使用）
+        output_path: 输出文件路径
+    """
+    with pdf_buffer:
+        pdf_buffer.seek(0)
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            shutil.copyfileobj(pdf_buffer, f, _WRITE_BUFFER_SIZE)
 
 
 def _find_optimal_dpi(
-    doc: fitz.Document,
+    input_path: str,
+    page_count: int,
     target_size_mb: float,
     logger_func: Callable[[str], None],
     tolerance: float = 0.05,
-) -> Tuple[float, Optional[bytes]]:
+    grayscale: bool = False,
+) -> Tuple[float, Optional[io.BytesIO]]:
     """
-    使用二分搜索找到最佳DPI以达到目标文件大小
+    根据文件大小模型搜索最佳DPI以达到目标文件大小
+
+    输出大小近似满足 size ≈ k * dpi^p（纯像素时 p ≈ 2）。先在 150 DPI 渲染一次
+    标定模型并直接求解目标 DPI，之后用已有采样点在对数空间做割线修正，
+    通常 2-3 次渲染即可进入容差范围。
 
     Args:
-        doc: PyMuPDF文档对象
+        input_path: PDF 文件路径
+        page_count: 文档页数
         target_size_mb: 目标文件大小（MB）
         logger_func: 日志记录函数
         tolerance: 容差范围
+        grayscale: 是否按灰度渲染页面
 
     Returns:
-        Tuple[best_dpi, best_pdf_data]: 最佳DPI和对应的PDF数据
+        Tuple[best_dpi, best_pdf_data]: 最佳DPI和对应的PDF数据；
+        最低 DPI 仍超过目标时返回最低 DPI 的结果，只有渲染失败时 PDF 数据才为 None
     """
-    dpi_low, dpi_high = 30, 300
-    best_dpi, best_pdf_data = dpi_low, None
+    dpi_min, dpi_max = 30, 300
+    best_dpi, best_pdf_data = dpi_min, None
+    # 目标无法达到时的兜底结果（最低 DPI），避免调用方再渲染一遍
+    min_dpi_pdf_data: Optional[io.BytesIO] = None
+
+    # 当前已知的上下界：dpi_low 生成的文件不超过目标，dpi_high 生成的文件超过目标
+    dpi_low, dpi_high = dpi_min - 1, dpi_max + 1
+    samples: List[Tuple[int, float]] = []
+
+    MAX_ATTEMPTS = 5
+    logger_func(f"Starting model-based search for best DPI (up to {MAX_ATTEMPTS} attempts)...")
+
+    dpi_guess = 150
+    # 第一次尝试之后只会向下或向上走：两个方向的第二个采样点同时预先渲染
+    low_anchor, high_anchor = 100, 212
+    speculative = _submit_speculative_renders(
+        input_path, page_count, (low_anchor, high_anchor), grayscale
+    )
+    try:
+        for i in range(MAX_ATTEMPTS):
+            logger_func(
+                f"\n[bold]Attempt {i + 1}/{MAX_ATTEMPTS}:[/bold] Trying DPI = {dpi_guess}"
+            )
+            pdf_data = _generate_pdf_data(
+                input_path,
+                page_count,
+                dpi_guess,
+                logger_func,
+                use_cache=True,
+                grayscale=grayscale,
+            )
 
-    ITERATIONS = 7
-    logger_func(f"Starting iterative search for best DPI ({ITERATIONS} iterations)...")
+            if not pdf_data:
+                logger_func(
+                    f"[yellow]Failed to generate PDF at DPI {dpi_guess}.[/yellow]"
+                )
+                break
 
-    for i in range(ITERATIONS):
-        dpi_guess = (dpi_low + dpi_high) / 2
-        if dpi_guess < dpi_low + 1:
-            break
+            current_size_mb = pdf_data.getbuffer().nbytes / (1024 * 1024)
+            logger_func(f"  - Generated size: {current_size_mb:.2f} MB")
 
-        logger_func(
-            f"\n[bold]Attempt {i + 1}/{ITERATIONS}:[/bold] Trying DPI = {int(dpi_guess)}"
-        )
-        pdf_data = _generate_pdf_data(doc, dpi_guess, logger_func)
+            # 不再需要的缓冲区立即关闭，搜索期间最多只保留一个最佳结果
+            if abs(current_size_mb - target_size_mb) / target_size_mb <= tolerance:
+                logger_func("[green]Result is within tolerance. Search finished.[/green]")
+                if best_pdf_data is not None:
+                    best_pdf_data.close()
+                best_dpi, best_pdf_data = dpi_guess, pdf_data
+                break
 
-        if not pdf_data:
-            logger_func(
-                f"[yellow]Failed to generate PDF at DPI {int(dpi_guess)}.[/yellow]"
-            )
-            dpi_high = dpi_guess
-            continue
-
-        current_size_mb = len(pdf_data) / (1024 * 1024)
-        logger_func(f"  - Generated size: {current_size_mb:.2f} MB")
+            if current_size_mb > target_size_mb:
+                dpi_high = dpi_guess
+                if dpi_guess == dpi_min:
+                    min_dpi_pdf_data = pdf_data
+                else:
+                    pdf_data.close()
+            else:
+                dpi_low = dpi_guess
+                if best_pdf_data is not None:
+                    best_pdf_data.close()
+                best_dpi, best_pdf_data = dpi_guess, pdf_data
+            samples.append((dpi_guess, current_size_mb))
+
+            # 用夹住目标的两个采样点（不足时用最近两个）拟合指数，只有一个点时假定 p = 2
+            exponent = 2.0
+            bracket = [sample for sample in samples if sample[0] in (dpi_low, dpi_high)]
+            fit_points = bracket if len(bracket) == 2 else samples[-2:]
+            if len(fit_points) == 2:
+                (d1, s1), (d2, s2) = fit_points
+                if d1 != d2 and s1 > 0 and s2 > 0 and s1 != s2:
+                    fitted = math.log(s2 / s1) / math.log(d2 / d1)
+                    if fitted > 0:
+                        exponent = fitted
+
+            next_dpi = round(dpi_guess * (target_size_mb / current_size_mb) ** (1 / exponent))
+            # 新的猜测必须落在当前区间内，保证每次尝试都缩小搜索范围
+            next_dpi = max(dpi_low + 1, min(dpi_high - 1, next_dpi))
+
+            # 第二次尝试改用已预先渲染好的候选 DPI，只需组装 PDF 即可得到第二个采样点；
+            # 候选 DPI 不在当前区间内或预渲染失败时，仍使用模型估计的 DPI
+            if speculative:
+                anchor = low_anchor if current_size_mb > target_size_mb else high_anchor
+                future = speculative.pop(anchor)
+                for other in speculative.values():
+                    other.cancel()
+                speculative.clear()
+                if dpi_low < anchor < dpi_high:
+                    try:
+                        _store_rendered_pages((input_path, anchor, grayscale), future.result())
+                        next_dpi = anchor
+                    except Exception as e:
+                        logger_func(
+                            f"[yellow]Pre-rendering at DPI {anchor} failed ({e}), "
+                            f"using the estimated DPI {next_dpi}.[/yellow]"
+                        )
+                else:
+                    future.cancel()
 
-        if abs(current_size_mb - target_size_mb) / target_size_mb <= tolerance:
-            logger_func("[green]Result is within tolerance. Search finished.[/green]")
-            best_dpi, best_pdf_data = dpi_guess, pdf_data
-            break
+            if next_dpi <= dpi_low or next_dpi >= dpi_high or next_dpi == dpi_guess:
+                break
+            dpi_guess = next_dpi
+    finally:
+        for future in speculative.values():
+            future.cancel()
 
-        if current_size_mb > target_size_mb:
-            dpi_high = dpi_guess
+    if min_dpi_pdf_data is not None:
+        if best_pdf_data is None:
+            logger_func(
+                f"[yellow]Target size is below what DPI {dpi_min} can reach, using the smallest result.[/yellow]"
+            )
+            best_pdf_data = min_dpi_pdf_data
         else:
-            dpi_low = dpi_guess
-            best_dpi, best_pdf_data = dpi_guess, pdf_data
+            min_dpi_pdf_data.close()
 
     return best_dpi, best_pdf_data
 
 
 def _find_optimal_dpi_for_pptx(
-    doc: fitz.Document,
+    input_path: str,
+    page_count: int,
     target_size_mb: float,
     logger_func: Callable[[str], None],
     tolerance: float = 0.05,
@@ -172,7 +669,8 @@ def _find_optimal_dpi_for_pptx(
     使用二分搜索找到最佳DPI以达到目标PPTX文件大小
 
     Args:
-        doc: PyMuPDF文档对象
+        input_path: PDF 文件路径
+        page_count: 文档页数
         target_size_mb: 目标PPTX文件大小（MB）
         logger_func: 日志记录函数
         tolerance: 容差范围
@@ -187,7 +685,8 @@ def _find_optimal_dpi_for_pptx(
     logger_func(f"Starting iterative search for best DPI targeting PPTX size ({ITERATIONS} iterations)...")
 
     for i in range(ITERATIONS):
-        dpi_guess = (dpi_low + dpi_high) / 2
+        # 取整后的 DPI 才能命中渲染缓存
+        dpi_guess = int((dpi_low + dpi_high) / 2)
         if dpi_guess < dpi_low + 1:
             break
 
@@ -196,7 +695,9 @@ def _find_optimal_dpi_for_pptx(
         )
 
         # 生成PDF数据
-        pdf_data = _generate_pdf_data(doc, dpi_guess, logger_func)
+        pdf_data = _generate_pdf_data(
+            input_path, page_count, dpi_guess, logger_func, use_cache=True
+        )
         if not pdf_data:
             logger_func(
                 f"[yellow]Failed to generate PDF at DPI {int(dpi_guess)}.[/yellow]"
@@ -207,8 +708,7 @@ def _find_optimal_dpi_for_pptx(
         # 将PDF转换为PPTX并检查PPTX文件大小
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_pdf:
             temp_pdf_path = temp_pdf.name
-            with open(temp_pdf_path, "wb") as f:
-                f.write(pdf_data)
+        _write_pdf_buffer(pdf_data, temp_pdf_path)
 
         with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as temp_pptx:
             temp_pptx_path = temp_pptx.name
@@ -257,6 +757,7 @@ def autocompress_pdf(
     target_size_mb: float,
     logger_func: Callable[[str], None],
     tolerance: float = 0.05,
+    grayscale: bool = False,
 ) -> None:
     """Automatically adjusts DPI to compress a PDF to a target size."""
     if not os.path.exists(input_path):
@@ -268,31 +769,45 @@ def autocompress_pdf(
         logger_func(
             "[bold yellow]Info:[/bold yellow] Target size is not smaller than the original. Copying file directly."
         )
-        import shutil
-
-        shutil.copy(input_path, output_path)
+        # 只复制文件内容：Linux 上走 sendfile/copy_file_range，macOS 上可直接克隆
+        shutil.copyfile(input_path, output_path)
         return
 
     logger_func("Starting auto-compression...")
     logger_func(f" - Original Size: {original_size_mb:.2f} MB")
     logger_func(f" - Target Size:   {target_size_mb:.2f} MB")
 
+    import fitz
+
     try:
-        doc = fitz.open(input_path)
+        with fitz.open(input_path) as doc:
+            page_count = len(doc)
     except Exception as e:
         logger_func(f"[bold red]Error:[/bold red] Could not open PDF. Reason: {e}")
         return
 
-    best_dpi, best_pdf_data = _find_optimal_dpi(doc, target_size_mb, logger_func, tolerance)
-    doc.close()
+    if grayscale:
+        logger_func(" - Rendering pages in grayscale")
 
-    if best_pdf_data is None:
-        logger_func(
-            "[yellow]Search finished without a perfect match. Regenerating with best found DPI...[/yellow]"
+    try:
+        best_dpi, best_pdf_data = _find_optimal_dpi(
+            input_path, page_count, target_size_mb, logger_func, tolerance, grayscale
         )
-        doc = fitz.open(input_path)
-        best_pdf_data = _generate_pdf_data(doc, best_dpi, logger_func)
-        doc.close()
+
+        if best_pdf_data is None:
+            logger_func(
+                "[yellow]Search finished without a perfect match. Regenerating with best found DPI...[/yellow]"
+            )
+            best_pdf_data = _generate_pdf_data(
+                input_path,
+                page_count,
+                best_dpi,
+                logger_func,
+                use_cache=True,
+                grayscale=grayscale,
+            )
+    finally:
+        _clear_render_cache()
 
     if not best_pdf_data:
         logger_func("[bold red]Error:[/bold red] Failed to generate final PDF.")
@@ -301,8 +816,7 @@ def autocompress_pdf(
     logger_func(
         f"\nSearch complete. Best DPI found: [bold cyan]{int(best_dpi)}[/bold cyan]. Saving file..."
     )
-    with open(output_path, "wb") as f:
-        f.write(best_pdf_data)
+    _write_pdf_buffer(best_pdf_data, output_path)
 
     final_size_mb = os.path.getsize(output_path) / (1024 * 1024)
     ratio = (1 - final_size_mb / original_size_mb) * 100 if original_size_mb > 0 else 0
@@ -337,8 +851,8 @@ def autocompress_pptx(
         logger_func(
             "[bold yellow]Info:[/bold yellow] Target size is not smaller than the original. Copying file directly."
         )
-        import shutil
-        shutil.copy(input_path, output_path)
+        # 只复制文件内容：Linux 上走 sendfile/copy_file_range，macOS 上可直接克隆
+        shutil.copyfile(input_path, output_path)
         return
 
     logger_func("Starting PPTX auto-compression...")
@@ -360,22 +874,29 @@ def autocompress_pptx(
 
         # 步骤2：使用DPI优化找到最佳压缩设置
         logger_func("Step 2: Finding optimal DPI for target size...")
+        import fitz
+
         try:
-            doc = fitz.open(temp_pdf_path)
+            with fitz.open(temp_pdf_path) as doc:
+                page_count = len(doc)
         except Exception as e:
             logger_func(f"[bold red]Error:[/bold red] Could not open temporary PDF. Reason: {e}")
             return
 
-        best_dpi, best_pdf_data = _find_optimal_dpi(doc, target_size_mb, logger_func, tolerance)
-        doc.close()
-
-        if best_pdf_data is None:
-            logger_func(
-                "[yellow]Search finished without a perfect match. Regenerating with best found DPI...[/yellow]"
+        try:
+            best_dpi, best_pdf_data = _find_optimal_dpi(
+                temp_pdf_path, page_count, target_size_mb, logger_func, tolerance
             )
-            doc = fitz.open(temp_pdf_path)
-            best_pdf_data = _generate_pdf_data(doc, best_dpi, logger_func)
-            doc.close()
+
+            if best_pdf_data is None:
+                logger_func(
+                    "[yellow]Search finished without a perfect match. Regenerating with best found DPI...[/yellow]"
+                )
+                best_pdf_data = _generate_pdf_data(
+                    temp_pdf_path, page_count, best_dpi, logger_func, use_cache=True
+                )
+        finally:
+            _clear_render_cache()
 
         if not best_pdf_data:
             logger_func("[bold red]Error:[/bold red] Failed to generate optimized PDF.")
@@ -385,8 +906,7 @@ def autocompress_pptx(
         logger_func("Step 3: Converting optimized PDF back to PPTX...")
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as optimized_pdf:
             optimized_pdf_path = optimized_pdf.name
-            with open(optimized_pdf_path, "wb") as f:
-                f.write(best_pdf_data)
+        _write_pdf_buffer(best_pdf_data, optimized_pdf_path)
 
         try:
             convert_to_ppt(optimized_pdf_path, output_path, int(best_dpi), logger_func)
@@ -442,16 +962,23 @@ def autocompress_pdf_to_pptx(
     logger_func(f" - Original Size: {original_size_mb:.2f} MB")
     logger_func(f" - Target Size:   {target_size_mb:.2f} MB")
 
+    import fitz
+
     try:
-        doc = fitz.open(input_path)
+        with fitz.open(input_path) as doc:
+            page_count = len(doc)
     except Exception as e:
         logger_func(f"[bold red]Error:[/bold red] Could not open PDF. Reason: {e}")
         return
 
     # 使用新的DPI优化逻辑，直接基于PPTX文件大小进行优化
     logger_func("Finding optimal DPI based on final PPTX size...")
-    best_dpi, best_pptx_path = _find_optimal_dpi_for_pptx(doc, target_size_mb, logger_func, tolerance)
-    doc.close()
+    try:
+        best_dpi, best_pptx_path = _find_optimal_dpi_for_pptx(
+            input_path, page_count, target_size_mb, logger_func, tolerance
+        )
+    finally:
+        _clear_render_cache()
 
     if best_pptx_path is None or not os.path.exists(best_pptx_path):
         logger_func("[bold red]Error:[/bold red] Failed to generate target-size PPTX.")
@@ -459,7 +986,6 @@ def autocompress_pdf_to_pptx(
 
     try:
         # 移动最佳PPTX文件到目标位置
-        import shutil
         shutil.move(best_pptx_path, output_path)
 
         final_size_mb = os.path.getsize(output_path) / (1024 * 1024)
@@ -483,11 +1009,12 @@ def autocompress(
     target_size_mb: float,
     logger_func: Callable[[str], None],
     tolerance: float = 0.05,
+    grayscale: bool = False,
 ) -> None:
     """
     通用的自动压缩函数，根据文件类型和输出格式调用相应的压缩函数
 
-    支持的转换：
+    支持的转换（grayscale 目前只作用于 PDF → PDF）：
     - PDF → PDF: 直接压缩
     - PPTX → PPTX: 转换为PDF → 压缩 → 转换回PPTX
     - PDF → PPTX: DPI优化 → 转换为PPTX
@@ -501,7 +1028,9 @@ def autocompress(
 
     # 根据输入和输出格式选择处理方式
     if input_ext == '.pdf' and output_ext == '.pdf':
-        autocompress_pdf(input_path, output_path, target_size_mb, logger_func, tolerance)
+        autocompress_pdf(
+            input_path, output_path, target_size_mb, logger_func, tolerance, grayscale
+        )
     elif input_ext == '.pptx' and output_ext == '.pptx':
         autocompress_pptx(input_path, output_path, target_size_mb, logger_func, tolerance)
     elif input_ext == '.pdf' and output_ext == '.pptx':
@@ -512,17 +1041,24 @@ def autocompress(
 
 
 def compress_pdf(
-    input_path: str, output_path: str, dpi: int, logger_func: Callable[[str], None]
+    input_path: str,
+    output_path: str,
+    dpi: int,
+    logger_func: Callable[[str], None],
+    grayscale: bool = False,
 ) -> None:
-    """Manually compresses a PDF using a specific DPI."""
+    """Manually compresses a PDF using a specific DPI (optionally in grayscale)."""
+    import fitz
+
     logger_func("Starting manual compression...")
-    doc = fitz.open(input_path)
-    pdf_data = _generate_pdf_data(doc, dpi, logger_func)
-    doc.close()
+    with fitz.open(input_path) as doc:
+        page_count = len(doc)
+    pdf_data = _generate_pdf_data(
+        input_path, page_count, dpi, logger_func, grayscale=grayscale
+    )
 
     if pdf_data:
-        with open(output_path, "wb") as f:
-            f.write(pdf_data)
+        _write_pdf_buffer(pdf_data, output_path)
 
         original_size = os.path.getsize(input_path) / (1024 * 1024)
         final_size = os.path.getsize(output_path) / (1024 * 1024)
@@ -536,27 +1072,32 @@ def compress_pdf(
 
 
 def check_conversion_tools() -> dict:
-    """检查系统中可用的转换工具"""
+    """
+    检查系统中可用的转换工具
+
+    重新在 PATH 中查找 LibreOffice / unoconv 并更新缓存的路径，
+    这样程序运行期间安装或卸载的工具也能被识别。
+    """
+    global _LIBREOFFICE_PATH, _UNOCONV_PATH
+
+    _LIBREOFFICE_PATH = shutil.which("libreoffice")
+    _UNOCONV_PATH = shutil.which("unoconv")
     tools = {}
 
     try:
         import subprocess
 
-        # 检查 LibreOffice
-        try:
-            subprocess.run(["libreoffice", "--version"],
-                         capture_output=True, timeout=5, check=True)
-            tools["libreoffice"] = True
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            tools["libreoffice"] = False
-
-        # 检查 unoconv
-        try:
-            subprocess.run(["unoconv", "--version"],
-                         capture_output=True, timeout=5, check=True)
-            tools["unoconv"] = True
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            tools["unoconv"] = False
+        # 检查 LibreOffice / unoconv（不在 PATH 中时无需启动子进程）
+        for name, path in (("libreoffice", _LIBREOFFICE_PATH), ("unoconv", _UNOCONV_PATH)):
+            if path is None:
+                tools[name] = False
+                continue
+            try:
+                subprocess.run([path, "--version"],
+                             capture_output=True, timeout=5, check=True)
+                tools[name] = True
+            except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                tools[name] = False
 
 
 
@@ -597,7 +1138,7 @@ def convert_pptx_to_pdf(
 
     try:
         # 使用不同平台的转换方法
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             _convert_pptx_to_pdf_windows(input_path, output_path, logger_func)
         else:
             _convert_pptx_to_pdf_cross_platform(input_path, output_path, logger_func)
@@ -679,8 +1220,28 @@ def _convert_pptx_to_pdf_cross_platform(
     _convert_pptx_fallback_method(input_path, output_path, logger_func)
 
 
+def _get_libreoffice_profile() -> str:
+    """
+    获取 LibreOffice 共享用户配置目录的 URI
+
+    所有转换复用同一个配置目录，只有第一次调用 LibreOffice 时需要初始化配置，
+    后续启动可以跳过这部分开销，也不会与用户正在运行的 LibreOffice 实例冲突。
+    """
+    global _LIBREOFFICE_PROFILE_DIR
+
+    if _LIBREOFFICE_PROFILE_DIR is None:
+        _LIBREOFFICE_PROFILE_DIR = tempfile.mkdtemp(prefix=f"lo_profile_{os.getpid()}_")
+        atexit.register(shutil.rmtree, _LIBREOFFICE_PROFILE_DIR, ignore_errors=True)
+
+    return Path(_LIBREOFFICE_PROFILE_DIR).as_uri()
+
+
 def _try_libreoffice_conversion(input_pptx: str, output_pdf: str, logger_func: Callable[[str], None]) -> bool:
     """使用 LibreOffice 转换 PPTX 到 PDF（保持完整样式）"""
+    if _LIBREOFFICE_PATH is None:
+        logger_func("  - LibreOffice not found in system PATH")
+        return False
+
     try:
         import subprocess
 
@@ -690,7 +1251,8 @@ def _try_libreoffice_conversion(input_pptx: str, output_pdf: str, logger_func: C
 
         # 使用 LibreOffice 命令行转换
         cmd = [
-            "libreoffice",
+            _LIBREOFFICE_PATH,
+            f"-env:UserInstallation={_get_libreoffice_profile()}",
             "--headless",
             "--convert-to", "pdf",
             "--outdir", output_dir,
@@ -725,11 +1287,15 @@ def _try_libreoffice_conversion(input_pptx: str, output_pdf: str, logger_func: C
 
 def _try_unoconv_conversion(input_pptx: str, output_pdf: str, logger_func: Callable[[str], None]) -> bool:
     """使用 unoconv 转换 PPTX 到 PDF"""
+    if _UNOCONV_PATH is None:
+        logger_func("  - unoconv not found in system PATH")
+        return False
+
     try:
         import subprocess
 
         logger_func("  - Running unoconv conversion...")
-        cmd = ["unoconv", "-f", "pdf", "-o", output_pdf, input_pptx]
+        cmd = [_UNOCONV_PATH, "-f", "pdf", "-o", output_pdf, input_pptx]
 
         subprocess.run(cmd, check=True, capture_output=True, timeout=60, text=True)
         return os.path.exists(output_pdf)
@@ -749,6 +1315,9 @@ def _try_unoconv_conversion(input_pptx: str, output_pdf: str, logger_func: Calla
 
 def _convert_pptx_fallback_method(input_path: str, output_path: str, logger_func: Callable[[str], None]) -> None:
     """备用方法：创建包含幻灯片信息的 PDF"""
+    import fitz
+    from pptx import Presentation
+
     try:
         logger_func("Using fallback method (text-only conversion)...")
 
@@ -770,29 +1339,33 @@ def _convert_pptx_fallback_method(input_path: str, output_path: str, logger_func
             # 创建新页面
             page = doc.new_page()
 
-            # 添加标题
-            title_rect = fitz.Rect(50, 50, 550, 100)
-            page.insert_textbox(title_rect, f"Slide {i+1}", fontsize=20, align=1)
+            # 收集本页所有文本框：(rect, text, fontsize, align)
+            texts = [(fitz.Rect(50, 50, 550, 100), f"Slide {i+1}", 20, 1)]
 
             # 提取并添加文本内容
             y_position = 120
             for shape in slide.shapes:
                 if hasattr(shape, 'text') and shape.text.strip():
                     text_rect = fitz.Rect(50, y_position, 550, y_position + 50)
-                    page.insert_textbox(text_rect, shape.text.strip(), fontsize=12, align=0)
+                    texts.append((text_rect, shape.text.strip(), 12, 0))
                     y_position += 60
 
                     if y_position > 750:  # 避免超出页面
                         break
 
             # 添加警告信息
-            warning_rect = fitz.Rect(50, 750, 550, 780)
-            page.insert_textbox(
-                warning_rect,
+            texts.append((
+                fitz.Rect(50, 750, 550, 780),
                 "⚠️ This is a text-only conversion. For full styling, install LibreOffice.",
-                fontsize=10,
-                align=1
-            )
+                10,
+                1,
+            ))
+
+            # TextWriter 在同一页的所有文本框之间复用字体，最后一次性写入页面
+            writer = fitz.TextWriter(page.rect)
+            for rect, text, fontsize, align in texts:
+                writer.fill_textbox(rect, text, fontsize=fontsize, align=align)
+            writer.write_text(page)
 
         # 保存 PDF
         doc.save(output_path)
@@ -811,6 +1384,8 @@ def _convert_pptx_fallback_method(input_path: str, output_path: str, logger_func
 
 def _create_placeholder_pdf(output_path: str, text: str, logger_func: Callable[[str], None]) -> None:
     """创建一个包含文本的占位符 PDF"""
+    import fitz
+
     try:
         doc = fitz.open()  # 创建新的 PDF 文档
         page = doc.new_page()  # 添加新页面
@@ -829,61 +1404,133 @@ def _create_placeholder_pdf(output_path: str, text: str, logger_func: Callable[[
 
 def _merge_pdfs(pdf_paths: list, output_path: str, logger_func: Callable[[str], None]) -> None:
     """合并多个 PDF 文件"""
+    import fitz
+
     try:
+        existing_paths = [pdf_path for pdf_path in pdf_paths if os.path.exists(pdf_path)]
         merged_doc = fitz.open()
 
-        for pdf_path in pdf_paths:
-            if os.path.exists(pdf_path):
-                doc = fitz.open(pdf_path)
+        for pdf_path in existing_paths:
+            # 明确文件类型以跳过格式探测；每个源文件只插入一次，保持默认 final=1
+            # 让 MuPDF 立即释放该文件的对象映射，插入后马上关闭源文件
+            with fitz.open(pdf_path, filetype="pdf") as doc:
                 merged_doc.insert_pdf(doc)
-                doc.close()
 
-        merged_doc.save(output_path)
+        # 一次性写出：garbage=4 + clean 合并重复的字体/图像等资源
+        merged_doc.save(
+            output_path,
+            garbage=4,
+            deflate=True,
+            deflate_images=True,
+            clean=True,
+        )
         merged_doc.close()
 
-        logger_func(f"✅ Merged {len(pdf_paths)} pages into final PDF")
+        logger_func(f"✅ Merged {len(existing_paths)} pages into final PDF")
 
     except Exception as e:
         logger_func(f"[bold red]Error:[/bold red] Failed to merge PDFs: {e}")
 
 
-def _optimize_image_for_pptx(img: Image.Image, target_quality: int = 85) -> bytes:
+def _optimize_image_for_pptx(
+    img: "Image.Image", target_quality: int = 85, lossless: bool = False
+) -> bytes:
     """
     优化图像以减小PPTX文件大小
 
+    convert_to_ppt 已按 _PPTX_MAX_IMAGE_DIMENSION 限制渲染尺寸，
+    这里的缩放只作为其他来源图像的兜底。
+
     Args:
         img: PIL图像对象
         target_quality: JPEG质量 (1-100)
+        lossless: 是否使用无损 PNG 编码（文件会大很多）
 
     Returns:
         bytes: 压缩后的图像数据
     """
-    img_buffer = io.BytesIO()
+    from PIL import Image
 
     # 如果图像很大，先进行适度缩放
-    max_dimension = 1920  # 最大尺寸限制
+    max_dimension = _PPTX_MAX_IMAGE_DIMENSION
     if max(img.width, img.height) > max_dimension:
         ratio = max_dimension / max(img.width, img.height)
         new_width = int(img.width * ratio)
         new_height = int(img.height * ratio)
         img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
+    if lossless:
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format='PNG', optimize=True)
+        return img_buffer.getvalue()
     # 使用JPEG压缩，在质量和文件大小之间取得平衡
-    img.save(img_buffer, format='JPEG', quality=target_quality, optimize=True)
-    return img_buffer.getvalue()
+    return _encode_jpeg(img, target_quality, optimize=True)
+
+
+def _render_slide_images(
+    input_path: str,
+    page_indices: List[int],
+    dpi: int,
+    quality: int,
+    lossless: bool = False,
+    logger_func: Optional[Callable[[str], None]] = None,
+) -> RenderedPages:
+    """
+    渲染指定页面并编码为幻灯片图像（可在工作进程中执行）
+
+    Args:
+        input_path: PDF 文件路径
+        page_indices: 需要渲染的页面索引
+        dpi: 渲染分辨率
+        quality: JPEG质量 (1-100)
+        lossless: 是否使用无损 PNG 编码
+        logger_func: 进度日志函数（仅在当前进程渲染时使用）
+
+    Returns:
+        RenderedPages: 与 page_indices 顺序一致的渲染结果
+    """
+    import fitz
+
+    def encode_page(page: "fitz.Page") -> bytes:
+        # 直接按最大边长限制渲染，避免先渲染大图再缩放
+        zoom = min(
+            dpi / 72,
+            _PPTX_MAX_IMAGE_DIMENSION / max(page.rect.width, page.rect.height),
+        )
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        img = _samples_to_image(pix.width, pix.height, pix.samples_mv, stride=pix.stride)
+        return _optimize_image_for_pptx(img, quality, lossless)
+
+    return _render_each_page(input_path, page_indices, encode_page, logger_func)
 
 
 def convert_to_ppt(
-    input_path: str, output_path: str, dpi: int, logger_func: Callable[[str], None]
+    input_path: str,
+    output_path: str,
+    dpi: int,
+    logger_func: Callable[[str], None],
+    lossless: bool = False,
 ) -> None:
-    """Converts a PDF to a PowerPoint presentation with optimized image compression."""
+    """
+    Converts a PDF to a PowerPoint presentation with optimized image compression.
+
+    Pages are embedded as JPEG by default; pass ``lossless=True`` to embed
+    PNG images instead (much larger, but without compression artifacts).
+    """
+    import fitz
+    from pptx import Presentation
+    from pptx.util import Inches
+
     logger_func("Starting PDF to PPT conversion...")
     doc = fitz.open(input_path)
     prs = Presentation()
     total_pages = len(doc)
 
     # 根据页面数量调整压缩质量
-    if total_pages > 50:
+    if lossless:
+        quality = 100
+        logger_func("Lossless mode enabled, embedding pages as PNG")
+    elif total_pages > 50:
         quality = 70  # 页面很多时使用更高压缩
         logger_func(f"Large document ({total_pages} pages), using higher compression (quality: {quality})")
     elif total_pages > 20:
@@ -893,22 +1540,49 @@ def convert_to_ppt(
         quality = 85  # 页面较少时使用较低压缩
         logger_func(f"Small document ({total_pages} pages), using standard compression (quality: {quality})")
 
-    for i, page in enumerate(doc):
-        logger_func(f"  - Processing page {i+1}/{total_pages}")
-        pix = page.get_pixmap(dpi=int(dpi))
+    # 大多数 PDF 所有页面尺寸一致，此时只需设置一次幻灯片尺寸
+    page_sizes = {(round(page.rect.width), round(page.rect.height)) for page in doc}
+    uniform_size = len(page_sizes) == 1
+    if uniform_size:
+        first_rect = doc[0].rect
+        prs.slide_width = Inches(first_rect.width / 72)
+        prs.slide_height = Inches(first_rect.height / 72)
+
+    doc.close()
 
-        # 转换为PIL图像并优化
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        img_data = _optimize_image_for_pptx(img, quality)
+    # 渲染和编码可并行进行；python-pptx 不是线程安全的，幻灯片仍在当前线程依次添加
+    rendered_pages = _render_pages(
+        input_path,
+        total_pages,
+        int(dpi),
+        logger_func,
+        _render_slide_images,
+        quality=quality,
+        lossless=lossless,
+    )
 
-        prs.slide_width = Inches(page.rect.width / 72)
-        prs.slide_height = Inches(page.rect.height / 72)
+    current_size = None
+    for i, (width, height, img_data, error) in enumerate(rendered_pages):
+        if img_data is None:
+            logger_func(
+                f"[bold red]Warning:[/bold red] Error processing page {i+1}, skipped. Error: {error}"
+            )
+            continue
+
+        # 页面尺寸不一致时，仅在尺寸变化时更新幻灯片尺寸
+        if not uniform_size:
+            page_size = (round(width), round(height))
+            if page_size != current_size:
+                prs.slide_width = Inches(width / 72)
+                prs.slide_height = Inches(height / 72)
+                current_size = page_size
         slide = prs.slides.add_slide(prs.slide_layouts[6])
-        slide.shapes.add_picture(
-            io.BytesIO(img_data), 0, 0, width=prs.slide_width, height=prs.slide_height
-        )
+        with io.BytesIO(img_data) as image_stream:
+            slide.shapes.add_picture(
+                image_stream, 0, 0, width=prs.slide_width, height=prs.slide_height
+            )
+    del rendered_pages
 
-    doc.close()
     prs.save(output_path)
     logger_func("\n[bold green]🎉 Conversion Complete![/bold green]")
     logger_func(f"  - Saved to: [cyan]{output_path}[/cyan]")
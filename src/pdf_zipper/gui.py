@@ -4,13 +4,25 @@ Graphical user interface for PDF Zipper using Textual.
 This module provides the TUI (Terminal User Interface) for PDF compression.
 """
 
+import asyncio
+import multiprocessing
 import os
+import platform
+import queue
+import stat
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from textual import work
+from rich.rule import Rule
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.events import Paste
+from textual.timer import Timer
 from textual.validation import Number
 from textual.widgets import (
     Button,
@@ -27,6 +39,7 @@ from textual.widgets import (
     TabPane,
 )
 
+from . import __version__, core
 from .core import (
     autocompress,
     autocompress_pdf,
@@ -34,71 +47,248 @@ from .core import (
     convert_to_ppt,
     convert_pptx_to_pdf,
     get_file_type,
-    validate_input_file,
     check_conversion_tools,
     SUPPORTED_INPUT_TYPES
 )
 
 
+# 版本和平台信息在进程生命周期内不会变化，导入时计算一次即可
+_STATIC_SYSINFO = (
+    __version__,
+    sys.version.split()[0],
+    platform.system(),
+    platform.release(),
+    platform.machine(),
+)
+
+# 静态的欢迎/帮助文本，预先拼接好，每次只需写入一次
+_WELCOME_TEXT = "\n".join((
+    "Welcome to PDF Zipper!",
+    "💡 提示：",
+    "  - 从左侧文件树选择文件 (PDF/PPTX)",
+    "  - 或使用「Custom Path」选项卡输入/拖拽文件路径",
+    "  - 然后点击对应的操作按钮开始处理",
+    "  - 支持的文件类型: PDF (.pdf), PowerPoint (.pptx)",
+))
+
+_LOG_INSTALL_TIPS = "\n".join((
+    "[bold yellow]💡 For better PPTX conversion with full styling:[/bold yellow]",
+    "  - Install LibreOffice: https://www.libreoffice.org/",
+    "  - Or unoconv: pip install unoconv",
+    "  - macOS: brew install --cask libreoffice",
+    "  - Ubuntu: sudo apt install libreoffice",
+))
+
+_INSTALL_TIPS = "\n".join((
+    "",
+    "💡 Installation Tips:",
+    "  • LibreOffice: https://www.libreoffice.org/",
+    "  • unoconv: pip install unoconv",
+    "  • macOS: brew install --cask libreoffice",
+    "  • Ubuntu: sudo apt install libreoffice",
+    "  • Windows: Download from official site",
+))
+
+_NO_FILE_TEXT = "\n".join((
+    "[bold red]Error: No file selected.[/bold red]",
+    "请先选择文件：",
+    "  1. 从左侧文件树选择文件 (PDF/PPTX)",
+    "  2. 或在「Custom Path」选项卡中输入文件路径",
+))
+
+# 自动压缩输出格式：RadioButton id -> (扩展名, 描述)
+_FORMAT_MAP = {"format-pdf": (".pdf", "PDF"), "format-pptx": (".pptx", "PPTX")}
+
+# 状态栏中显示的转换工具名称
+_TOOL_LABELS = {"libreoffice": "LibreOffice", "unoconv": "unoconv"}
+
+# 不支持的文件类型提示中使用的扩展名列表
+_SUPPORTED_TYPES_STR = ", ".join(SUPPORTED_INPUT_TYPES.keys())
+
+# 受支持的输入扩展名（小写，含点）
+_SUPPORTED_EXTS = frozenset(SUPPORTED_INPUT_TYPES)
+
+# 文件类型只取决于扩展名，可以直接缓存
+_cached_file_type = lru_cache(maxsize=256)(get_file_type)
+
+# 从 Finder 等处拖拽/粘贴路径时可能带有引号和空白
+_QUOTES = " \t\r\n\"'"
+
+# 压缩/转换任务共用的线程数
+_JOB_WORKERS = 2
+
+# 使用进程池运行任务时的进程数
+_JOB_PROCESSES = os.cpu_count() or 1
+
+# 日志最多保留的行数，超出后丢弃最早的行（代替每次任务前清空日志）
+_LOG_MAX_LINES = 2000
+
+# 后台任务日志合并写入的间隔（秒）
+_LOG_FLUSH_INTERVAL = 0.05
+
+# 输入路径时停止键入多久后才进行校验（秒）
+_VALIDATE_DEBOUNCE = 0.15
+
+# stat 结果的短期缓存：path -> (是否存在, 是否为普通文件, 过期时间)，输入路径时避免反复访问磁盘
+_STAT_TTL = 2.0
+_STAT_CACHE_MAX = 256
+_stat_cache: Dict[str, Tuple[bool, bool, float]] = {}
+
+
+def _stat_cached(path: str) -> Tuple[bool, bool]:
+    """带 TTL 的单次 os.stat，返回 (是否存在, 是否为普通文件)"""
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and cached[2] > now:
+        return cached[0], cached[1]
+
+    try:
+        mode = os.stat(path).st_mode
+        exists, is_file = True, stat.S_ISREG(mode)
+    except (OSError, ValueError):
+        exists, is_file = False, False
+    if len(_stat_cache) >= _STAT_CACHE_MAX:
+        _stat_cache.clear()
+    _stat_cache[path] = (exists, is_file, now + _STAT_TTL)
+    return exists, is_file
+
+
+def _clear_path_caches() -> None:
+    """清空路径检查缓存（刷新文件树时调用）"""
+    _stat_cache.clear()
+
+
+def _clean_path(raw: str) -> str:
+    """去除路径两端的引号和空白"""
+    return raw.strip(_QUOTES)
+
+
+def _classify_path(path: str) -> Tuple[bool, bool, str, str, bool]:
+    """
+    一次性完成路径检查（可能访问慢速/网络磁盘，应在后台线程中调用）
+
+    只调用一次 os.stat；受支持要求是普通文件且扩展名受支持。
+
+    Returns:
+        Tuple[exists, is_regular_file, extension, description, supported]
+    """
+    exists, is_file = _stat_cached(path)
+    ext, desc = _cached_file_type(path)
+    return exists, is_file, ext, desc, is_file and ext in _SUPPORTED_EXTS
+
+
+async def _classify_path_async(path: str) -> Tuple[bool, bool, str, str, bool]:
+    """在默认线程池中执行 _classify_path（asyncio.to_thread 需要 Python 3.9+）"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _classify_path, path)
+
+
+def _init_job_process() -> None:
+    """任务子进程初始化：任务之间已经并行，页面渲染不再另开进程池"""
+    core._RENDER_WORKERS = 1
+    # 子进程与界面共用终端，直接输出会破坏 TUI 画面；日志统一经由队列发回
+    sys.stdout = sys.stderr = open(os.devnull, "w")
+
+
+def _run_job_in_process(func: Callable[..., None], args: Tuple[Any, ...], log_queue) -> None:
+    """
+    任务子进程入口（模块级函数，便于 pickle）
+
+    Args:
+        func: core 中的任务函数，最后一个参数为日志函数
+        args: 除日志函数外的参数
+        log_queue: 主进程 Manager 提供的队列，日志消息经由它发回界面
+    """
+    func(*args, log_queue.put)
+
+
+class FilteredDirectoryTree(DirectoryTree):
+    """只显示目录和受支持文件（PDF/PPTX）的文件树，隐藏以 . 开头的条目"""
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        paths = list(paths)
+        if not paths:
+            return paths
+
+        # 重新 scandir 一次父目录，用 dirent 中已有的类型判断目录，避免逐个 stat
+        dir_names: Set[str] = set()
+        try:
+            with os.scandir(paths[0].parent) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dir_names.add(entry.name)
+        except OSError:
+            dir_names = {path.name for path in paths if path.is_dir()}
+
+        return [
+            path
+            for path in paths
+            if not path.name.startswith(".")
+            and (path.name in dir_names or path.suffix.lower() in _SUPPORTED_EXTS)
+        ]
+
+
+class _LogBuffer:
+    """
+    合并后台线程产生的日志消息，定时一次性写入 RichLog
+
+    长时间的压缩任务会输出大量进度行，逐行 call_from_thread 写入会让界面
+    每行都重绘一次，并且每条消息都要唤醒事件循环。工作线程只把消息放入
+    无锁的 SimpleQueue，由主线程定时取出并拼接后只写一次。
+    """
+
+    def __init__(self, log: RichLog) -> None:
+        self._log = log
+        self._queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self._sources = [self._queue]
+
+    def write(self, message: str) -> None:
+        """追加一条消息（可在任意线程调用，不会阻塞）"""
+        self._queue.put_nowait(message)
+
+    def add_source(self, source) -> None:
+        """额外从另一个队列（例如子进程日志队列）中读取消息"""
+        self._sources.append(source)
+
+    def flush(self) -> None:
+        """在主线程中把所有待写入的消息一次性写入日志"""
+        batch: List[str] = []
+        for source in self._sources:
+            try:
+                while True:
+                    batch.append(source.get_nowait())
+            except queue.Empty:
+                pass
+        if batch:
+            self._log.write("\n".join(batch))
+
+
 class PDFZipperApp(App):
     """Main application class for PDF Zipper GUI."""
 
-    CSS_PATH = None  # We'll define CSS inline
+    # 样式表放在独立文件中，Textual 按路径加载并缓存
+    CSS_PATH = Path(__file__).parent / "app.tcss"
     BINDINGS = [("q", "quit", "Quit"), ("f5", "refresh_tree", "Refresh Tree")]
 
-    # Inline CSS
-    CSS = """
-    #tree-view {
-        width: 30%;
-        dock: left;
-    }
-    
-    #main-view {
-        width: 70%;
-        dock: right;
-    }
-    
-    #selected-file {
-        height: 3;
-        margin: 1;
-        padding: 1;
-        border: solid $primary;
-    }
-    
-    #tabs {
-        height: auto;
-        margin: 1;
-    }
-    
-    #custom-operations {
-        height: 3;
-        margin: 1;
-    }
-    
-    #log {
-        height: 1fr;
-        margin: 1;
-        border: solid $secondary;
-    }
-    
-    Button {
-        margin: 0 1;
-    }
-    
-    Input {
-        margin: 1 0;
-    }
-    
-    Label {
-        margin: 1 0 0 0;
-    }
-    """
+    # 当前选中的输入文件，未选择时为 None
+    selected_path: Optional[Path] = None
+
+    def __init__(self, use_processes: bool = False) -> None:
+        """
+        Args:
+            use_processes: 在独立进程中运行压缩/转换任务，多个任务可真正并行
+        """
+        super().__init__()
+        self._use_processes = use_processes
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_manager = None
+        self._process_log_queue = None
 
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
         yield Header(name="🗜️ PDF Zipper")
         with Container():
-            yield DirectoryTree(".", id="tree-view")
+            yield FilteredDirectoryTree(".", id="tree-view")
             with Vertical(id="main-view"):
                 yield Static(
                     "Select a file (PDF/PPTX) from the tree or enter custom path.",
@@ -171,92 +361,136 @@ class PDFZipperApp(App):
                         yield Button(
                             "Refresh Info", variant="default", id="btn-refresh-info"
                         )
-                yield RichLog(id="log", wrap=True, highlight=True, markup=True)
+                yield RichLog(
+                    id="log", wrap=True, highlight=True, markup=True, max_lines=_LOG_MAX_LINES
+                )
         yield Footer()
 
     def on_mount(self) -> None:
         """Initialize the application."""
-        self.query_one(DirectoryTree).focus()
-        log = self.query_one(RichLog)
-        log.write("Welcome to PDF Zipper!")
-        log.write("💡 提示：")
-        log.write("  - 从左侧文件树选择文件 (PDF/PPTX)")
-        log.write("  - 或使用「Custom Path」选项卡输入/拖拽文件路径")
-        log.write("  - 然后点击对应的操作按钮开始处理")
-        log.write("  - 支持的文件类型: PDF (.pdf), PowerPoint (.pptx)")
-
-        # 检查转换工具状态
+        self._validate_timer: Optional[Timer] = None
+        # 上一次已校验的自定义路径，值未变化时跳过重复校验
+        self._last_validated_path: Optional[str] = None
+        # 布局是静态的，缓存常用控件，避免每次事件都遍历 DOM 查找
+        self._log = self.query_one(RichLog)
+        self._log_buffer = _LogBuffer(self._log)
+        # 所有任务复用同一组线程，而不是每次点击都创建新线程
+        self._executor = ThreadPoolExecutor(
+            max_workers=_JOB_WORKERS, thread_name_prefix="pdfzip"
+        )
+        self.set_interval(_LOG_FLUSH_INTERVAL, self._log_buffer.flush)
+        self._selected_file = self.query_one("#selected-file", Static)
+        self._custom_path = self.query_one("#custom-path", Input)
+        self._status_widget = self.query_one("#conversion-tools-status", Static)
+        self._system_info = self.query_one("#system-info-display", Static)
+        self._tabs = self.query_one("#tabs", TabbedContent)
+        self._tree = self.query_one(DirectoryTree)
+        self._auto_size = self.query_one("#auto-size", Input)
+        self._output_format = self.query_one("#output-format", RadioSet)
+        self._manual_dpi = self.query_one("#manual-dpi", Input)
+        self._ppt_dpi = self.query_one("#ppt-dpi", Input)
+        self._tree.focus()
+        # 按钮 id -> (处理方法, 默认参数)；默认参数为 None 时从对应输入框读取
+        self._button_handlers = {
+            "btn-custom-auto": (self._do_auto, 5.0),  # 默认5MB
+            "btn-auto": (self._do_auto, None),
+            "btn-custom-manual": (self._do_manual, 150),  # 默认DPI
+            "btn-manual": (self._do_manual, None),
+            "btn-custom-ppt": (self._do_ppt, 150),
+            "btn-ppt": (self._do_ppt, None),
+            "btn-pptx-pdf": (self._do_pptx_pdf, None),
+            "btn-refresh-info": (self._do_refresh_info, None),
+        }
+        self._log.write(_WELCOME_TEXT)
+
+        # 检查转换工具状态（后台进行，不阻塞首次绘制）
+        self.conversion_tools: Dict[str, bool] = {}
+        self._tools_available: Tuple[str, ...] = ()
+        self._tools_missing: Tuple[str, ...] = ()
+        self._tools_any = False
+        self._start_tools_check()
+        # 系统信息在首次打开「System Info」选项卡时才生成
+
+    def on_unmount(self) -> None:
+        """退出时释放任务线程池"""
+        self._executor.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_manager.shutdown()
+
+    def _start_tools_check(self) -> None:
+        """显示检测中的占位信息，并在后台检查转换工具"""
+        self._log.write("🔍 Checking conversion tools...")
+        self._status_widget.update("[dim]🔍 Detecting conversion tools...[/dim]")
         self._check_conversion_tools()
 
-        # 更新系统信息显示
-        self._update_system_info()
-
+    @work(thread=True, exclusive=True, group="tool-check")
     def _check_conversion_tools(self) -> None:
-        """检查系统中可用的转换工具并更新状态显示"""
+        """在后台线程检查系统中可用的转换工具，完成后更新状态显示"""
         try:
-            log = self.query_one(RichLog)
-            log.write("🔍 Checking conversion tools...")
-
-            self.conversion_tools = check_conversion_tools()
-            self._update_tools_status_display()
-            self._log_tools_status()
-
+            tools = check_conversion_tools()
         except Exception as e:
-            log = self.query_one(RichLog)
-            log.write(f"[bold yellow]Warning:[/bold yellow] Failed to check conversion tools: {e}")
+            self.call_from_thread(
+                self._log.write,
+                f"[bold yellow]Warning:[/bold yellow] Failed to check conversion tools: {e}",
+            )
+            tools = {}
+
+        self.call_from_thread(self._apply_conversion_tools, tools)
+
+    def _apply_conversion_tools(self, tools: Dict[str, bool]) -> None:
+        """在主线程中保存工具检查结果并刷新相关显示"""
+        self.conversion_tools = tools
+        # 只遍历一次结果，后续显示方法直接使用这些派生值
+        self._tools_available = tuple(k for k, v in tools.items() if v)
+        self._tools_missing = tuple(k for k, v in tools.items() if not v)
+        self._tools_any = bool(self._tools_available)
+        self._update_tools_status_display()
+        self._log_tools_status()
+        if self._tabs.active == "tab-system":
+            self._update_system_info()
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """切换到系统信息选项卡时再生成系统信息"""
+        if event.pane.id == "tab-system":
+            self._update_system_info()
 
     def _log_tools_status(self) -> None:
         """在日志中显示工具状态"""
         if not self.conversion_tools:
             return
 
-        log = self.query_one(RichLog)
-
-        # 检查可用工具
-        available_tools = []
-        missing_tools = []
-
-        for tool, available in self.conversion_tools.items():
-            if available:
-                available_tools.append(tool)
-            else:
-                missing_tools.append(tool)
-
-        if available_tools:
-            log.write(f"✅ Available conversion tools: {', '.join(available_tools)}")
+        # 所有行拼接后一次写入，只触发一次渲染
+        lines = []
+        if self._tools_available:
+            lines.append(f"✅ Available conversion tools: {', '.join(self._tools_available)}")
 
-        if missing_tools:
-            log.write(f"❌ Missing tools: {', '.join(missing_tools)}")
+        if self._tools_missing:
+            lines.append(f"❌ Missing tools: {', '.join(self._tools_missing)}")
 
         # 提供安装建议
-        if not any(self.conversion_tools.values()):
-            log.write("[bold yellow]💡 For better PPTX conversion with full styling:[/bold yellow]")
-            log.write("  - Install LibreOffice: https://www.libreoffice.org/")
-            log.write("  - Or unoconv: pip install unoconv")
-            log.write("  - macOS: brew install --cask libreoffice")
-            log.write("  - Ubuntu: sudo apt install libreoffice")
+        if not self._tools_any:
+            lines.append(_LOG_INSTALL_TIPS)
         else:
-            log.write("🎉 PPTX to PDF conversion will preserve full styling!")
+            lines.append("🎉 PPTX to PDF conversion will preserve full styling!")
+
+        self._log.write("\n".join(lines))
 
     def _update_tools_status_display(self) -> None:
         """更新工具状态显示"""
         try:
-            status_widget = self.query_one("#conversion-tools-status")
+            status_widget = self._status_widget
 
             if not self.conversion_tools:
                 status_widget.update("[bold red]⚠️ Tool status check failed[/bold red]")
                 return
 
             # 检查是否有任何高质量转换工具可用
-            has_good_tools = any(self.conversion_tools.values())
-
-            if has_good_tools:
+            if self._tools_any:
                 # 显示可用的工具
-                available_tools = []
-                if self.conversion_tools.get("libreoffice"):
-                    available_tools.append("✅ LibreOffice")
-                if self.conversion_tools.get("unoconv"):
-                    available_tools.append("✅ unoconv")
+                available_tools = [
+                    f"✅ {_TOOL_LABELS.get(tool, tool)}" for tool in self._tools_available
+                ]
 
                 status_text = "🔧 Available tools: " + ", ".join(available_tools)
                 status_widget.update(f"[bold green]{status_text}[/bold green]")
@@ -274,18 +508,15 @@ class PDFZipperApp(App):
     def _update_system_info(self) -> None:
         """更新系统信息显示"""
         try:
-            import platform
-            import sys
-            from pdf_zipper import __version__
-
-            system_info_widget = self.query_one("#system-info-display")
+            system_info_widget = self._system_info
+            version, python_version, system, release, machine = _STATIC_SYSINFO
 
             # 收集系统信息
             info_lines = [
-                f"📦 PDF Zipper: v{__version__}",
-                f"🐍 Python: {sys.version.split()[0]}",
-                f"💻 System: {platform.system()} {platform.release()}",
-                f"🏗️  Architecture: {platform.machine()}",
+                f"📦 PDF Zipper: v{version}",
+                f"🐍 Python: {python_version}",
+                f"💻 System: {system} {release}",
+                f"🏗️  Architecture: {machine}",
                 "",
                 "🔧 Conversion Tools Status:",
             ]
@@ -299,16 +530,8 @@ class PDFZipperApp(App):
                 info_lines.append("  ⚠️ Tool check not completed")
 
             # 添加安装建议
-            if self.conversion_tools and not any(self.conversion_tools.values()):
-                info_lines.extend([
-                    "",
-                    "💡 Installation Tips:",
-                    "  • LibreOffice: https://www.libreoffice.org/",
-                    "  • unoconv: pip install unoconv",
-                    "  • macOS: brew install --cask libreoffice",
-                    "  • Ubuntu: sudo apt install libreoffice",
-                    "  • Windows: Download from official site"
-                ])
+            if self.conversion_tools and not self._tools_any:
+                info_lines.append(_INSTALL_TIPS)
 
             system_info_text = "\n".join(info_lines)
             system_info_widget.update(system_info_text)
@@ -316,7 +539,7 @@ class PDFZipperApp(App):
         except Exception:
             # 如果更新失败，显示错误信息
             try:
-                system_info_widget = self.query_one("#system-info-display")
+                system_info_widget = self._system_info
                 system_info_widget.update("❌ Failed to load system information")
             except Exception:
                 pass
@@ -325,232 +548,293 @@ class PDFZipperApp(App):
         self, event: DirectoryTree.FileSelected
     ) -> None:
         """Handle file selection from directory tree."""
-        file_path = str(event.path)
-        if validate_input_file(file_path):
-            ext, desc = get_file_type(file_path)
-            self.query_one("#selected-file").update(
-                f"Selected: [bold cyan]{event.path}[/bold cyan] ({desc})"
+        self._validate_tree_selection(event.path)
+
+    @work(exclusive=True, group="tree-selection")
+    async def _validate_tree_selection(self, path: Path) -> None:
+        """在后台线程校验文件树中选中的文件；快速切换选择时会取消之前的校验"""
+        _, _, ext, desc, supported = await _classify_path_async(str(path))
+        if supported:
+            self._selected_file.update(
+                f"Selected: [bold cyan]{path}[/bold cyan] ({desc})"
             )
-            self.selected_path = event.path
-            # 同时更新自定义路径输入框
-            self.query_one("#custom-path").value = str(event.path)
+            self.selected_path = path
+            # 同时更新自定义路径输入框（已校验过，无需再次检查）
+            self._last_validated_path = str(path)
+            self._custom_path.value = str(path)
         else:
-            ext, desc = get_file_type(file_path)
-            supported_types = ", ".join(SUPPORTED_INPUT_TYPES.keys())
-            self.query_one("#selected-file").update(
-                f"[bold red]Unsupported file type: {ext}. Supported: {supported_types}[/bold red]"
+            self._selected_file.update(
+                f"[bold red]Unsupported file type: {ext}. Supported: {_SUPPORTED_TYPES_STR}[/bold red]"
             )
             self.selected_path = None
 
-    def on_paste(self, event: Paste) -> None:
+    async def on_paste(self, event: Paste) -> None:
         """Handle paste events for drag and drop functionality."""
-        # 检查粘贴的内容是否是文件路径
-        pasted_text = event.text.strip()
-
-        # 预处理粘贴的文本，去除可能的引号
-        if pasted_text:
-            if (pasted_text.startswith("'") and pasted_text.endswith("'")) or (
-                pasted_text.startswith('"') and pasted_text.endswith('"')
-            ):
-                pasted_text = pasted_text[1:-1].strip()
-
-        if pasted_text and (
-            validate_input_file(pasted_text) or os.path.exists(pasted_text)
-        ):
+        # 检查粘贴的内容是否是文件路径（去除可能的引号）
+        pasted_text = _clean_path(event.text)
+        if not pasted_text:
+            return
+
+        # 文件系统检查放到线程中，避免慢速磁盘阻塞界面
+        exists, _, _, _, supported = await _classify_path_async(pasted_text)
+        if supported or exists:
             # 如果当前焦点在自定义路径输入框
             try:
-                custom_input = self.query_one("#custom-path")
+                custom_input = self._custom_path
                 if custom_input.has_focus:
                     custom_input.value = pasted_text
-                    self._update_selected_path_from_custom()
+                    await self._update_selected_path_from_custom()
             except Exception:
                 pass
 
-    def _update_selected_path_from_custom(self):
+    async def _update_selected_path_from_custom(self) -> None:
         """Update selected path from custom input."""
-        custom_path = self.query_one("#custom-path").value.strip()
-
         # 处理从 Finder 拖拽时的引号包裹问题
-        if custom_path:
-            # 去除前后的单引号或双引号
-            if (custom_path.startswith("'") and custom_path.endswith("'")) or (
-                custom_path.startswith('"') and custom_path.endswith('"')
-            ):
-                custom_path = custom_path[1:-1]
-
-            # 再次去除可能的空格
-            custom_path = custom_path.strip()
-
-        if custom_path and os.path.exists(custom_path) and validate_input_file(custom_path):
-            ext, desc = get_file_type(custom_path)
+        custom_path = _clean_path(self._custom_path.value)
+        if custom_path == self._last_validated_path:
+            return
+        if not custom_path:
+            self._last_validated_path = custom_path
+            self._selected_file.update(
+                "Select a file (PDF/PPTX) from the tree or enter custom path."
+            )
+            self.selected_path = None
+            return
+
+        raw_value = self._custom_path.value
+        exists, _, ext, desc, supported = await _classify_path_async(custom_path)
+        # 等待检查期间输入框内容已变化时，丢弃这次过期的结果
+        if self._custom_path.value != raw_value:
+            return
+        self._last_validated_path = custom_path
+
+        if supported:
             self.selected_path = Path(custom_path)
-            self.query_one("#selected-file").update(
+            self._selected_file.update(
                 f"Custom: [bold cyan]{custom_path}[/bold cyan] ({desc})"
             )
-        elif custom_path:
-            if os.path.exists(custom_path):
-                ext, desc = get_file_type(custom_path)
-                supported_types = ", ".join(SUPPORTED_INPUT_TYPES.keys())
-                self.query_one("#selected-file").update(
-                    f"[bold red]Unsupported file type: {ext}. Supported: {supported_types}[/bold red]"
+        else:
+            if exists:
+                self._selected_file.update(
+                    f"[bold red]Unsupported file type: {ext}. Supported: {_SUPPORTED_TYPES_STR}[/bold red]"
                 )
             else:
-                self.query_one("#selected-file").update(
+                self._selected_file.update(
                     f"[bold red]File not found: {custom_path}[/bold red]"
                 )
             self.selected_path = None
-        else:
-            self.query_one("#selected-file").update(
-                "Select a file (PDF/PPTX) from the tree or enter custom path."
-            )
-            self.selected_path = None
 
-    def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle input changes."""
-        if event.input.id == "custom-path":
-            self._update_selected_path_from_custom()
+    @on(Input.Changed, "#custom-path")
+    def _on_custom_path_changed(self, event: Input.Changed) -> None:
+        """Handle custom path input changes."""
+        # 连续输入时只在停顿后校验一次最终的路径
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+            self._validate_timer = None
+        # 改回已校验过的值（例如输入后又删除）时无需再安排校验
+        if _clean_path(event.value) == self._last_validated_path:
+            return
+        self._validate_timer = self.set_timer(
+            _VALIDATE_DEBOUNCE, self._update_selected_path_from_custom
+        )
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """首次使用时创建任务进程池，以及把子进程日志发回界面的队列"""
+        if self._process_pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._process_manager = ctx.Manager()
+            self._process_log_queue = self._process_manager.Queue()
+            self._log_buffer.add_source(self._process_log_queue)
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=_JOB_PROCESSES,
+                mp_context=ctx,
+                initializer=_init_job_process,
+            )
+        return self._process_pool
+
+    async def _run_job(self, func: Callable[..., None], *args) -> None:
+        """在共享线程池（或启用时的进程池）中运行耗时任务"""
+        loop = asyncio.get_running_loop()
+        if self._use_processes:
+            pool: Executor = self._get_process_pool()
+            job = partial(_run_job_in_process, func, args, self._process_log_queue)
+        else:
+            pool = self._executor
+            job = partial(func, *args, self._log_buffer.write)
+        await loop.run_in_executor(pool, job)
 
-    @work(thread=True)
-    def worker_autocompress(
-        self, input_path: str, output_path: str, target_size: float, logger_func
+    @work(group="jobs")
+    async def worker_autocompress(
+        self, input_path: str, output_path: str, target_size: float
     ) -> None:
         """Worker for auto compression (supports both PDF and PPTX)."""
-        autocompress(input_path, output_path, target_size, logger_func)
+        await self._run_job(autocompress, input_path, output_path, target_size)
 
-    @work(thread=True)
-    def worker_manual_compress(
-        self, input_path: str, output_path: str, dpi: int, logger_func
+    @work(group="jobs")
+    async def worker_manual_compress(
+        self, input_path: str, output_path: str, dpi: int
     ) -> None:
         """Worker for manual compression."""
-        compress_pdf(input_path, output_path, dpi, logger_func)
+        await self._run_job(compress_pdf, input_path, output_path, dpi)
 
-    @work(thread=True)
-    def worker_convert_ppt(
-        self, input_path: str, output_path: str, dpi: int, logger_func
+    @work(group="jobs")
+    async def worker_convert_ppt(
+        self, input_path: str, output_path: str, dpi: int
     ) -> None:
         """Worker for PPT conversion."""
-        convert_to_ppt(input_path, output_path, dpi, logger_func)
+        await self._run_job(convert_to_ppt, input_path, output_path, dpi)
 
-    @work(thread=True)
-    def worker_convert_pptx_to_pdf(
-        self, input_path: str, output_path: str, logger_func
+    @work(group="jobs")
+    async def worker_convert_pptx_to_pdf(
+        self, input_path: str, output_path: str
     ) -> None:
         """Worker for PPTX to PDF conversion."""
-        convert_pptx_to_pdf(input_path, output_path, logger_func)
+        await self._run_job(convert_pptx_to_pdf, input_path, output_path)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses and dispatch jobs."""
-        log = self.query_one(RichLog)
-        log.clear()
-
-        if not hasattr(self, "selected_path") or self.selected_path is None:
-            log.write("[bold red]Error: No file selected.[/bold red]")
-            log.write("请先选择文件：")
-            log.write("  1. 从左侧文件树选择文件 (PDF/PPTX)")
-            log.write("  2. 或在「Custom Path」选项卡中输入文件路径")
+        entry = self._button_handlers.get(event.button.id)
+        if entry is None:
             return
+        handler, default = entry
 
-        input_path = str(self.selected_path)
-        base, ext = os.path.splitext(os.path.basename(input_path))
-        input_ext, input_desc = get_file_type(input_path)
+        # 线程模式下同一时间只运行一个任务，避免多个任务争抢 CPU、日志互相穿插；
+        # 进程模式本身就是为了并行处理多个文件
+        if handler != self._do_refresh_info and not self._use_processes and self._job_running():
+            self.notify("A job is already running. Please wait for it to finish.", severity="warning")
+            return
+
+        # 先写出上一个任务残留的消息，保证本次按钮的输出排在它们之后
+        self._log_buffer.flush()
 
-        # Common logger function
-        def logger(message):
-            self.call_from_thread(log.write, message)
+        if self.selected_path is None:
+            self._log.write(_NO_FILE_TEXT)
+            return
 
-        # Handle custom path operations (quick with defaults)
-        if event.button.id == "btn-custom-auto":
-            target_size = 5.0  # 默认5MB
-            log.write(f"使用默认目标大小: {target_size} MB")
+        input_path = str(self.selected_path)
+        base = self.selected_path.stem
+        input_ext, _ = _cached_file_type(input_path)
+
+        handler(default, input_path, base, input_ext)
+
+    def _job_running(self) -> bool:
+        """是否有压缩/转换任务正在运行"""
+        return any(worker.group == "jobs" and worker.is_running for worker in self.workers)
+
+    def _begin_job(self) -> None:
+        """参数校验通过、即将启动任务时，用分隔线标出新的任务"""
+        self._log.write(Rule(title="New job"))
+
+    def _read_input_number(self, widget: Input, cast, error: str):
+        """读取并校验数字输入框，无效时写入错误信息并返回 None"""
+        if not widget.is_valid or not widget.value:
+            self._log.write(f"[bold red]Error: {error}[/bold red]")
+            return None
+        return cast(widget.value)
+
+    # 「Custom Path」选项卡的按钮传入默认参数，其他选项卡从输入框读取
+    def _do_auto(self, default: Optional[float], input_path: str, base: str, input_ext: str) -> None:
+        if default is not None:
+            target_size = default
+            self._begin_job()
+            self._log.write(f"使用默认目标大小: {target_size} MB")
             # Auto-compression keeps the original file format
-            output_path = f"{base}_auto_compressed{input_ext}"
-            self.worker_autocompress(input_path, output_path, target_size, logger)
-
-        elif event.button.id == "btn-custom-manual":
-            dpi = 150  # 默认DPI
-            log.write(f"使用默认DPI: {dpi}")
-            output_path = f"{base}_manual_compressed.pdf"
-            self.worker_manual_compress(input_path, output_path, dpi, logger)
-
-        elif event.button.id == "btn-custom-ppt":
-            dpi = 150  # 默认DPI
-            log.write(f"使用默认DPI: {dpi}")
-            output_path = f"{base}_converted.pptx"
-            self.worker_convert_ppt(input_path, output_path, dpi, logger)
-
-        elif event.button.id == "btn-auto":
-            target_size_input = self.query_one("#auto-size", Input)
-            if not target_size_input.is_valid or not target_size_input.value:
-                log.write("[bold red]Error: Invalid target size.[/bold red]")
+            output_ext = input_ext
+        else:
+            target_size = self._read_input_number(self._auto_size, float, "Invalid target size.")
+            if target_size is None:
                 return
-            target_size = float(target_size_input.value)
+            self._begin_job()
 
             # 获取输出格式选择
-            format_radio = self.query_one("#output-format", RadioSet)
-            selected_format = format_radio.pressed_button
-
-            if selected_format and selected_format.id == "format-pdf":
-                output_ext = ".pdf"
-                format_desc = "PDF"
-            elif selected_format and selected_format.id == "format-pptx":
-                output_ext = ".pptx"
-                format_desc = "PPTX"
-            else:
-                # 默认保持原格式
-                output_ext = input_ext
-                format_desc = "same as input"
-
-            output_path = f"{base}_auto_compressed{output_ext}"
-            log.write(f"输出格式: {format_desc}")
-            self.worker_autocompress(input_path, output_path, target_size, logger)
-
-        elif event.button.id == "btn-manual":
-            dpi_input = self.query_one("#manual-dpi", Input)
-            if not dpi_input.is_valid or not dpi_input.value:
-                log.write("[bold red]Error: Invalid DPI value.[/bold red]")
-                return
-            dpi = int(dpi_input.value)
-            output_path = f"{base}_manual_compressed.pdf"
-            self.worker_manual_compress(input_path, output_path, dpi, logger)
-
-        elif event.button.id == "btn-ppt":
-            # PDF to PowerPoint conversion
-            if input_ext != ".pdf":
-                log.write("[bold red]Error: PDF to PPT conversion requires a PDF file.[/bold red]")
-                return
-            dpi_input = self.query_one("#ppt-dpi", Input)
-            if not dpi_input.is_valid or not dpi_input.value:
-                log.write("[bold red]Error: Invalid DPI value.[/bold red]")
+            selected_format = self._output_format.pressed_button
+            # 默认保持原格式
+            output_ext, format_desc = _FORMAT_MAP.get(
+                selected_format.id if selected_format else None,
+                (input_ext, "same as input"),
+            )
+            self._log.write(f"输出格式: {format_desc}")
+
+        output_path = f"{base}_auto_compressed{output_ext}"
+        self.worker_autocompress(input_path, output_path, target_size)
+
+    def _do_manual(self, default: Optional[int], input_path: str, base: str, input_ext: str) -> None:
+        if default is not None:
+            dpi = default
+            self._begin_job()
+            self._log.write(f"使用默认DPI: {dpi}")
+        else:
+            dpi = self._read_input_number(self._manual_dpi, int, "Invalid DPI value.")
+            if dpi is None:
                 return
-            dpi = int(dpi_input.value)
-            output_path = f"{base}_converted.pptx"
-            self.worker_convert_ppt(input_path, output_path, dpi, logger)
-
-        elif event.button.id == "btn-pptx-pdf":
-            # PowerPoint to PDF conversion
-            if input_ext != ".pptx":
-                log.write("[bold red]Error: PPTX to PDF conversion requires a PowerPoint file.[/bold red]")
+            self._begin_job()
+        output_path = f"{base}_manual_compressed.pdf"
+        self.worker_manual_compress(input_path, output_path, dpi)
+
+    def _do_ppt(self, default: Optional[int], input_path: str, base: str, input_ext: str) -> None:
+        # PDF to PowerPoint conversion
+        if input_ext != ".pdf":
+            self._log.write("[bold red]Error: PDF to PPT conversion requires a PDF file.[/bold red]")
+            return
+        if default is not None:
+            dpi = default
+            self._begin_job()
+            self._log.write(f"使用默认DPI: {dpi}")
+        else:
+            dpi = self._read_input_number(self._ppt_dpi, int, "Invalid DPI value.")
+            if dpi is None:
                 return
-            output_path = f"{base}_converted.pdf"
-            self.worker_convert_pptx_to_pdf(input_path, output_path, logger)
+            self._begin_job()
+        output_path = f"{base}_converted.pptx"
+        self.worker_convert_ppt(input_path, output_path, dpi)
+
+    def _do_pptx_pdf(self, default: None, input_path: str, base: str, input_ext: str) -> None:
+        # PowerPoint to PDF conversion
+        if input_ext != ".pptx":
+            self._log.write("[bold red]Error: PPTX to PDF conversion requires a PowerPoint file.[/bold red]")
+            return
+        self._begin_job()
+        output_path = f"{base}_converted.pdf"
+        self.worker_convert_pptx_to_pdf(input_path, output_path)
 
-        elif event.button.id == "btn-refresh-info":
-            # 刷新系统信息
-            log.write("🔄 Refreshing system information...")
-            self._check_conversion_tools()
-            self._update_system_info()
-            log.write("✅ System information updated")
+    def _do_refresh_info(self, default: None, input_path: str, base: str, input_ext: str) -> None:
+        # 刷新系统信息
+        self._log.write("🔄 Refreshing system information...")
+        self._start_tools_check()
 
     def action_refresh_tree(self) -> None:
         """刷新文件树"""
-        log = self.query_one(RichLog)
+        log = self._log
         log.write("🔄 Refreshing file tree...")
-        tree = self.query_one(DirectoryTree)
-        tree.reload_node(tree.root)
+        _clear_path_caches()
+        self._last_validated_path = None
+        self._tree.reload_node(self._tree.root)
         log.write("✅ File tree refreshed")
 
 
-def launch_gui():
+def _install_uvloop() -> bool:
+    """
+    如果安装了 uvloop（可选依赖），使用它作为事件循环
+
+    Returns:
+        bool: 是否已启用 uvloop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def launch_gui(use_processes: bool = False):
     """Launch the PDF Zipper GUI application."""
-    app = PDFZipperApp()
+    _install_uvloop()
+    if os.name == "posix":
+        # Textual 运行时会把 sys.stderr 换成 fileno() 为 -1 的对象，
+        # 此后再启动 resource tracker（spawn 进程池需要）会失败，因此提前启动
+        from multiprocessing import resource_tracker
+
+        resource_tracker.ensure_running()
+    app = PDFZipperApp(use_processes=use_processes)
     app.run()
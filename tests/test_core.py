@@ -5,8 +5,11 @@ Tests for core PDF processing functionality.
 import pytest
 import tempfile
 import os
+import subprocess
+import sys
 from pathlib import Path
 
+from pdf_zipper import core
 from pdf_zipper.core import (
     compress_pdf,
     get_file_type,
@@ -15,16 +18,49 @@ from pdf_zipper.core import (
 )
 
 
-def test_compress_pdf_basic():
+def _make_pdf(path, pages=4):
+    """Create a small multi-page PDF for tests."""
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1}", fontsize=24)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_compress_pdf_basic(tmp_path):
     """Test basic PDF compression functionality."""
-    # This is a placeholder test - in a real scenario you'd need a test PDF file
-    pass
+    import fitz
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=3)
+    output_path = tmp_path / "output.pdf"
+
+    compress_pdf(pdf_path, str(output_path), 30, lambda msg: None)
 
+    with fitz.open(str(output_path)) as doc:
+        assert len(doc) == 3
 
-def test_autocompress_pdf_basic():
+
+def test_autocompress_pdf_basic(tmp_path):
     """Test auto compression functionality."""
-    # This is a placeholder test - in a real scenario you'd need a test PDF file
-    pass
+    import fitz
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=2)
+    output_path = tmp_path / "output.pdf"
+    messages = []
+
+    try:
+        # 目标小于原文件，才会进入 DPI 搜索
+        core.autocompress_pdf(pdf_path, str(output_path), 0.0005, messages.append)
+    finally:
+        core._clear_render_cache()
+
+    with fitz.open(str(output_path)) as doc:
+        assert len(doc) == 2
+    assert any("Trying DPI" in msg for msg in messages)
 
 
 def test_invalid_input_file():
@@ -103,5 +139,184 @@ def test_supported_input_types():
     assert SUPPORTED_INPUT_TYPES[".pptx"] == "PowerPoint Presentation"
 
 
+def test_generate_pdf_data_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that process-pool rendering keeps every page in order."""
+    import fitz
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=5)
+
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 1)
+    serial = core._generate_pdf_data(pdf_path, 5, 30, lambda msg: None)
+
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 2)
+    messages = []
+    parallel = core._generate_pdf_data(pdf_path, 5, 30, messages.append)
+
+    # 确认结果确实来自进程池，而不是静默退回了单进程渲染
+    assert not any("Parallel rendering unavailable" in msg for msg in messages)
+    assert core._RENDER_POOL is not None
+
+    with fitz.open(stream=serial, filetype="pdf") as a, fitz.open(stream=parallel, filetype="pdf") as b:
+        assert len(a) == len(b) == 5
+        assert [p.rect for p in a] == [p.rect for p in b]
+
+
+def test_generate_pdf_data_embeds_rendered_jpeg_unchanged(tmp_path, monkeypatch):
+    """Test that each page JPEG is encoded once and inserted without re-encoding."""
+    import fitz
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=1)
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 1)
+
+    rendered = core._render_page_range(pdf_path, [0], dpi=30)
+    pdf_data = core._generate_pdf_data(pdf_path, 1, 30, lambda msg: None)
+
+    with fitz.open(stream=pdf_data, filetype="pdf") as doc:
+        xref, *_, image_filter, _ = doc[0].get_images(full=True)[0]
+        assert image_filter == "DCTDecode"
+        assert doc.xref_stream_raw(xref) == bytes(rendered.data)
+
+
+def test_compress_pdf_grayscale_releases_pixmaps(tmp_path):
+    """Test that grayscale compression frees page images before their pixmaps."""
+    import fitz
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=2)
+    output_path = tmp_path / "output.pdf"
+    # 在子进程中运行：Pixmap.__del__ 的 BufferError 会被 pytest 截获为警告，不会写到 stderr
+    code = (
+        "import sys; from pdf_zipper import core; core._RENDER_WORKERS = 1; "
+        "core.compress_pdf(sys.argv[1], sys.argv[2], 30, lambda msg: None, grayscale=True)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, pdf_path, str(output_path)],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert "BufferError" not in result.stderr
+    with fitz.open(str(output_path)) as doc:
+        assert len(doc) == 2
+
+
+def test_convert_to_ppt_parallel_keeps_slide_order(tmp_path, monkeypatch):
+    """Test that PDF to PPTX renders slides in the pool and keeps page order."""
+    from pptx import Presentation
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=5)
+    pptx_path = str(tmp_path / "output.pptx")
+
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 2)
+    core.convert_to_ppt(pdf_path, pptx_path, 30, lambda msg: None)
+
+    prs = Presentation(pptx_path)
+    assert len(prs.slides) == 5
+    assert all(len(slide.shapes) == 1 for slide in prs.slides)
+
+
+def test_find_optimal_dpi_converges_in_few_renders(monkeypatch):
+    """Test that the size model reaches the target without a full bisection."""
+    import io
+
+    tried = []
+
+    def fake_generate(input_path, page_count, dpi, logger_func, **kwargs):
+        tried.append(dpi)
+        # 近似 size ∝ dpi^2.2，再加上固定开销
+        return io.BytesIO(b"\0" * int(20 * dpi ** 2.2 + 50_000))
+
+    monkeypatch.setattr(core, "_generate_pdf_data", fake_generate)
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 1)
+    target_mb = 2.0
+    best_dpi, best_data = core._find_optimal_dpi("in.pdf", 1, target_mb, lambda msg: None)
+
+    size_mb = best_data.getbuffer().nbytes / (1024 * 1024)
+    assert abs(size_mb - target_mb) / target_mb <= 0.05
+    assert tried[0] == 150
+    assert len(tried) <= 3
+
+
+def test_find_optimal_dpi_uses_speculative_render(tmp_path, monkeypatch):
+    """Test that small documents pre-render the second search point in the pool."""
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=2)
+    messages = []
+
+    monkeypatch.setattr(core, "_RENDER_WORKERS", 2)
+    # 推测执行只使用已存在的进程池，不会为此单独启动工作进程
+    core._get_render_pool()
+    try:
+        # 目标远小于 150 DPI 的结果，第二次尝试应直接使用预渲染的 100 DPI
+        core._find_optimal_dpi(pdf_path, 2, 0.001, messages.append)
+    finally:
+        core._clear_render_cache()
+
+    attempts = [msg for msg in messages if "Trying DPI" in msg]
+    assert "DPI = 150" in attempts[0]
+    assert "DPI = 100" in attempts[1]
+    assert any("Reusing pages already rendered at DPI 100" in msg for msg in messages)
+
+
+def test_find_optimal_dpi_reports_failed_speculative_render(tmp_path, monkeypatch):
+    """Test that a failed pre-render is logged and the model estimate is used instead."""
+    from concurrent.futures import Future
+
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=2)
+    messages = []
+
+    def failing_speculation(input_path, page_count, dpis, grayscale):
+        futures = {}
+        for dpi in dpis:
+            futures[dpi] = Future()
+            futures[dpi].set_exception(RuntimeError("worker died"))
+        return futures
+
+    monkeypatch.setattr(core, "_submit_speculative_renders", failing_speculation)
+    try:
+        core._find_optimal_dpi(pdf_path, 2, 0.001, messages.append)
+    finally:
+        core._clear_render_cache()
+
+    attempts = [msg for msg in messages if "Trying DPI" in msg]
+    assert any("Pre-rendering at DPI 100 failed (worker died)" in msg for msg in messages)
+    assert "DPI = 100" not in attempts[1]
+
+
+def test_render_cache_reuses_pages_until_cleared(tmp_path):
+    """Test that repeated renders at the same DPI hit the render cache."""
+    pdf_path = _make_pdf(tmp_path / "input.pdf", pages=2)
+
+    try:
+        first = core._render_pages_cached(pdf_path, 2, 30, lambda msg: None)
+        second = core._render_pages_cached(pdf_path, 2, 30, lambda msg: None)
+        assert first is second
+    finally:
+        core._clear_render_cache()
+
+    assert not core._RENDER_CACHE
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Test that importing the package and CLI defers PyMuPDF/Pillow/python-pptx."""
+    code = (
+        "import sys, pdf_zipper, pdf_zipper.cli; "
+        "print(','.join(m for m in ('fitz', 'PIL', 'pptx', 'textual') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_gui_import_does_not_load_heavy_dependencies():
+    """Test that importing the GUI module still defers PyMuPDF/Pillow/python-pptx."""
+    code = (
+        "import sys, pdf_zipper.gui; "
+        "print(','.join(m for m in ('fitz', 'PIL', 'pptx') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
 if __name__ == "__main__":
     pytest.main([__file__])